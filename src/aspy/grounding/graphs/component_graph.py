@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING, List, Optional, Self, Set, Tuple, Type
 
 from .dependency_graph import DependencyGraph
@@ -21,7 +22,7 @@ class Component:
         self.neg_edges = neg_edges if neg_edges is not None else set()
         self.stratified = stratified
 
-    @property
+    @cached_property
     def edges(self: Self) -> Set[Tuple["Statement", "Statement"]]:
         return self.pos_edges.union(self.neg_edges)
 
@@ -170,7 +171,7 @@ class ComponentGraph(object):
 
         return graph
 
-    @property
+    @cached_property
     def edges(self: Self) -> Set[Tuple["Statement", "Statement"]]:
         return self.pos_edges.union(self.neg_edges)
 
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Self, Set, Tuple
+from collections import defaultdict
+from itertools import product
+from typing import TYPE_CHECKING, Self, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover
     from aspy.program.statements import Statement
@@ -6,36 +8,75 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class DependencyGraph:
     def __init__(self: Self, rules: Tuple["Statement", ...]) -> None:
-        self.nodes = rules
+        pos_edges = set()
+        neg_edges = set()
 
-        self.pos_edges = set()
-        self.neg_edges = set()
+        # group rules by their predicate signature (head, pos. body, neg. body)
+        sig_rules = defaultdict(list)
 
-        for dependee in rules:
-            head_predicates = set(literal.pred() for literal in dependee.consequents())
+        for rule in rules:
+            body_literals = rule.antecedents()
 
-            for depender in rules:
-                # skip self
-                if depender is dependee:
-                    continue
+            head_preds = frozenset(literal.pred() for literal in rule.consequents())
+            pos_preds = frozenset(literal.pred() for literal in body_literals.pos_occ())
+            neg_preds = frozenset(literal.pred() for literal in body_literals.neg_occ())
 
-                body_predicates = depender.antecedents()
+            sig_rules[(head_preds, pos_preds, neg_preds)].append(rule)
 
-                pos_body_predicates = set(
-                    [literal.pred() for literal in body_predicates.pos_occ()]
-                )
-                neg_body_predicates = set(
-                    [literal.pred() for literal in body_predicates.neg_occ()]
-                )
+        # index signatures by predicates occurring in their heads and bodies
+        head_sigs = defaultdict(list)
+        pos_body_sigs = defaultdict(list)
+        neg_body_sigs = defaultdict(list)
 
-                # positive dependency
-                if head_predicates.intersection(pos_body_predicates):
-                    self.pos_edges.add((depender, dependee))
+        for sig in sig_rules:
+            head_preds, pos_preds, neg_preds = sig
 
-                # negative dependency
-                if head_predicates.intersection(neg_body_predicates):
-                    self.neg_edges.add((depender, dependee))
+            for pred in head_preds:
+                head_sigs[pred].append(sig)
+            for pred in pos_preds:
+                pos_body_sigs[pred].append(sig)
+            for pred in neg_preds:
+                neg_body_sigs[pred].append(sig)
 
-    @property
-    def edges(self: Self) -> Set[Tuple["Statement", "Statement"]]:
-        return self.pos_edges.union(self.neg_edges)
+        # a rule depends on another rule iff they share a predicate (head vs. body)
+        pos_sig_edges = set()
+        neg_sig_edges = set()
+
+        for body_sigs, sig_edges in (
+            (pos_body_sigs, pos_sig_edges),
+            (neg_body_sigs, neg_sig_edges),
+        ):
+            # shared predicates (probe smaller index against the larger one)
+            if len(head_sigs) <= len(body_sigs):
+                shared_preds = [pred for pred in head_sigs if pred in body_sigs]
+            else:
+                shared_preds = [pred for pred in body_sigs if pred in head_sigs]
+
+            for pred in shared_preds:
+                for dependee_sig in head_sigs[pred]:
+                    for depender_sig in body_sigs[pred]:
+                        sig_edges.add((depender_sig, dependee_sig))
+
+        # expand signature edges to rule edges
+        for sig_edges, edges in (
+            (pos_sig_edges, pos_edges),
+            (neg_sig_edges, neg_edges),
+        ):
+            for depender_sig, dependee_sig in sig_edges:
+                rule_pairs = product(sig_rules[depender_sig], sig_rules[dependee_sig])
+
+                if depender_sig is dependee_sig:
+                    # skip self
+                    edges.update(
+                        (depender, dependee)
+                        for depender, dependee in rule_pairs
+                        if depender is not dependee
+                    )
+                else:
+                    edges.update(rule_pairs)
+
+        # graph is not modified after construction
+        self.nodes = tuple(rules)
+        self.pos_edges = frozenset(pos_edges)
+        self.neg_edges = frozenset(neg_edges)
+        self.edges = self.pos_edges | self.neg_edges
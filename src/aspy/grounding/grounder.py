@@ -1,9 +1,8 @@
 import warnings
 from collections import defaultdict
-from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Self, Set, Type
+from typing import TYPE_CHECKING, Dict, Optional, Self, Set, Tuple, Type
 
-from aspy.program.literals import AggrLiteral, BuiltinLiteral, Equal, Naf, PredLiteral
+from aspy.program.literals import Equal, Naf, PredLiteral
 from aspy.program.program import Program
 from aspy.program.statements import Constraint
 from aspy.program.substitution import Substitution
@@ -16,6 +15,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from aspy.program.literals import Literal, LiteralCollection
     from aspy.program.statements import Statement
 
+    # predicate literals grouped by identifier, arity and classical negation
+    LiteralIndex = Dict[Tuple[str, int, bool], Set["PredLiteral"]]
+
 
 class Grounder:
     def __init__(self: Self, prog: Program) -> None:
@@ -39,7 +41,7 @@ class Grounder:
 
         # find appropriate literal
         for literal in literals:
-            if isinstance(literal, AggrLiteral):
+            if literal.is_aggr:
                 # TODO: raise exception (should have been replaced)
                 raise ValueError(
                     f"Aggregate literals should be replaced before calling {cls.select} during grounding."  # noqa
@@ -47,13 +49,44 @@ class Grounder:
 
             # either literal is positive (pos_occ() is non-empy) or literal is ground
             # under the substitution (all variables in 'literal' replaced by 'subst')
-            if literal.pos_occ() or all(subst[var].ground for var in literal.vars()):
+            # NOTE: 'get' avoids copying the targets of the substitution
+            if literal.pos_occ() or all(
+                subst.get(var, var).ground for var in literal.vars()
+            ):
                 return literal
 
         raise ValueError(
             f"Tuple of literals {tuple(str(literal.substitute(subst)) for literal in literals)} does not contain any appropriate literals for 'select'."
         )
 
+    @classmethod
+    def index_literals(
+        cls: Type["Grounder"], literals: Set["Literal"]
+    ) -> "LiteralIndex":
+        """Groups predicate literals by their signature and classical negation.
+
+        Predicate literals can only be matched to predicate literals with the same
+        identifier, arity and classical negation. Grouping them accordingly restricts
+        the candidates for a match to the relevant literals.
+
+        Args:
+            literals: Set of `Literal` instances.
+
+        Returns:
+            Dictionary mapping tuples of identifier, arity and classical negation to
+            sets of `PredLiteral` instances.
+        """
+        index = dict()
+
+        for literal in literals:
+            # only predicate literals can be matched to
+            if literal.is_pred:
+                index.setdefault((literal.name, literal.arity, literal.neg), set()).add(
+                    literal
+                )
+
+        return index
+
     @classmethod
     def matches(
         cls: Type["Grounder"],
@@ -61,6 +94,7 @@ class Grounder:
         certain: Optional[Set["Literal"]] = None,
         possible: Optional[Set["Literal"]] = None,
         subst: Optional["Substitution"] = None,
+        possible_index: Optional["LiteralIndex"] = None,
     ) -> Set["Substitution"]:
         # initialize optional arguments
         if subst is None:
@@ -73,7 +107,8 @@ class Grounder:
         # apply (partial) substitution
         literal = literal.substitute(subst)
 
-        if isinstance(literal, PredLiteral):
+        # NOTE: class flags avoid (slow) abstract base class instance checks
+        if literal.is_pred:
             # positive predicate literal
             if not literal.naf:
                 matches = set()
@@ -82,9 +117,19 @@ class Grounder:
                     if literal in possible:
                         matches.add(subst)
                 else:
+                    # only consider literals of the same predicate (if indexed)
+                    targets = (
+                        possible
+                        if possible_index is None
+                        else possible_index.get(
+                            (literal.name, literal.arity, literal.neg), ()
+                        )
+                    )
+
                     # compute possible match substitutions
-                    for target in possible:
-                        match = literal.substitute(subst).match(target)
+                    # (literal is already substituted above)
+                    for target in targets:
+                        match = literal.match(target)
 
                         if match is not None:
                             matches.add(subst.compose(match))
@@ -93,12 +138,10 @@ class Grounder:
             # ground negative predicate literal
             elif literal.ground:
                 # literal does not contradict set of certain (positive) literals
-                # (used as a check)
-                return (
-                    {subst} if Naf(deepcopy(literal), False) not in certain else set()
-                )
+                # (used as a check; 'Naf' already operates on a copy of the literal)
+                return {subst} if Naf(literal, False) not in certain else set()
         # ground built-in literal
-        elif isinstance(literal, BuiltinLiteral) and literal.ground:
+        elif literal.is_builtin and literal.ground:
             # relation holds (used as a check)
             return {subst} if literal.eval() else set()
 
@@ -115,6 +158,7 @@ class Grounder:
         prev_possible: Optional[Set["Literal"]] = None,
         subst: Optional["Substitution"] = None,
         duplicate: bool = False,
+        possible_index: Optional["LiteralIndex"] = None,
     ) -> Set["Statement"]:
         """Algorithm 1 from TODO."""
         if statement.contains_aggregates:
@@ -138,27 +182,36 @@ class Grounder:
         if literals is None:
             # get body literals
             literals = statement.body
+        if possible_index is None:
+            # index possible literals once for all (recursive) matches
+            possible_index = cls.index_literals(possible)
 
         # while literals to be processed
         if literals:
             # select positive predicate or ground literal
             literal = cls.select(literals, subst)
 
+            # remaining literals are the same for all matches (computed once)
+            remaining_literals = literals.without(literal)
+
             # compute matches for selected literal and ground remaining literals
-            return set().union(
-                *tuple(
+            instances = set()
+
+            for match in cls.matches(literal, certain, possible, subst, possible_index):
+                instances.update(
                     cls.ground_statement(
                         statement,
-                        literals.without(literal),
+                        remaining_literals,
                         certain,
                         possible,
                         prev_possible,
                         match,
                         duplicate,
+                        possible_index,
                     )
-                    for match in cls.matches(literal, certain, possible, subst)
                 )
-            )
+
+            return instances
         else:
             # check replaced arithmetic terms
             for var, target in subst.items():
@@ -232,6 +285,9 @@ class Grounder:
         converged = False
 
         while not converged:
+            # index possible literals once for all epsilon/eta rules
+            literals_K_index = self.index_literals(literals_K)
+
             # ground aggregate epsilon rules
             # (encode the satisfiability of aggregates without any element instances)
             aggr_eps_instances.update(
@@ -245,6 +301,7 @@ class Grounder:
                             prev_literals_K,
                             Substitution(),
                             duplicate,
+                            literals_K_index,
                         )
                         for rule in prog_aggr_eps.statements
                     )
@@ -262,6 +319,7 @@ class Grounder:
                             prev_literals_K,
                             Substitution(),
                             duplicate,
+                            literals_K_index,
                         )
                         for rule in prog_aggr_eta.statements
                     )
@@ -277,6 +335,12 @@ class Grounder:
                 literals_J_alpha,
             )
 
+            # possible literals for remaining rules (including propagated aggregates)
+            # are the same for all of them (computed & indexed once)
+            literals_J_possible = literals_J.union(literals_J_alpha)
+            literals_J_possible_index = self.index_literals(literals_J_possible)
+            prev_literals_J_possible = prev_literals_J.union(prev_literals_J_alpha)
+
             # ground remaining rules (including non-aggregate rules)
             alpha_instances.update(
                 set().union(
@@ -285,10 +349,11 @@ class Grounder:
                             rule,
                             rule.body,
                             literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
+                            literals_J_possible,
+                            prev_literals_J_possible,
                             Substitution(),
                             duplicate,
+                            literals_J_possible_index,
                         )
                         for rule in prog_alpha.statements
                     )
@@ -301,10 +366,11 @@ class Grounder:
                             rule,
                             rule.body,
                             literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
+                            literals_J_possible,
+                            prev_literals_J_possible,
                             Substitution(),
                             duplicate,
+                            literals_J_possible_index,
                         )
                         for rule in prog_choice_eps.statements
                     )
@@ -317,10 +383,11 @@ class Grounder:
                             rule,
                             rule.body,
                             literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
+                            literals_J_possible,
+                            prev_literals_J_possible,
                             Substitution(),
                             duplicate,
+                            literals_J_possible_index,
                         )
                         for rule in prog_choice_eta.statements
                     )
@@ -28,9 +28,27 @@ class AggrPropagator:
         literals_J: Set["Literal"],
         literals_J_alpha: Set["Literal"],
     ) -> Set[AggrPlaceholder]:
+        # aggregate information per aggregate id (looked up once per call)
+        aggr_info = dict()
+
         for rule in chain(eps_instances, eta_instances):
-            # get corresponding alpha_literal
-            aggr_literal, alpha_literal, *_ = self.aggr_map[rule.ref_id]
+            info = aggr_info.get(rule.ref_id)
+
+            if info is None:
+                # get corresponding alpha_literal
+                aggr_literal, alpha_literal, *_ = self.aggr_map[rule.ref_id]
+                # guards without variables can be shared by all instances
+                static_guards = all(
+                    guard is None or guard.ground for guard in aggr_literal.guards
+                )
+
+                info = aggr_info[rule.ref_id] = (
+                    aggr_literal,
+                    alpha_literal,
+                    static_guards,
+                )
+
+            aggr_literal, alpha_literal, static_guards = info
 
             if isinstance(rule, AggrBaseRule):
                 # gather variable substitution
@@ -42,7 +60,9 @@ class AggrPropagator:
                     self.instance_map[ground_alpha_literal] = (
                         aggr_literal.func,
                         set(),
-                        tuple(
+                        aggr_literal.guards
+                        if static_guards
+                        else tuple(
                             guard.substitute(subst) if guard is not None else None
                             for guard in aggr_literal.guards
                         ),
@@ -57,7 +77,9 @@ class AggrPropagator:
                     self.instance_map[ground_alpha_literal] = (
                         aggr_literal.func,
                         set(),
-                        tuple(
+                        aggr_literal.guards
+                        if static_guards
+                        else tuple(
                             guard.substitute(subst) if guard is not None else None
                             for guard in aggr_literal.guards
                         ),
@@ -18,7 +18,11 @@ class ChoicePropagator:
         ],
     ) -> None:
         self.choice_map = choice_map
-        self.instance_map = dict()
+        # ground choice elements and guards per ground chi literal
+        self.elements_map = dict()
+        self.guards_map = dict()
+        # rule instances that have already been processed
+        self.processed_instances = set()
 
     def propagate(
         self: Self,
@@ -29,58 +33,69 @@ class ChoicePropagator:
         literals_J: Set["Literal"],
         literals_J_chi: Set["Literal"],
     ) -> Set[ChoicePlaceholder]:
+        # choice information per choice id (looked up once per call)
+        choice_info = dict()
+
         for rule in chain(eps_instances, eta_instances):
-            # get corresponding chi_literal
-            choice, chi_literal, *_ = self.choice_map[rule.ref_id]
-
-            if isinstance(rule, ChoiceBaseRule):
-                # gather variable substitution
-                subst = rule.gather_var_assignment()
-                # ground corresponding chi literal
-                ground_chi_literal = chi_literal.substitute(subst)
-
-                if ground_chi_literal not in self.instance_map:
-                    self.instance_map[ground_chi_literal] = (
-                        set(),
-                        tuple(
-                            guard.substitute(subst) if guard is not None else None
-                            for guard in choice.guards
-                        ),
-                    )
-            elif isinstance(rule, ChoiceElemRule):
-                # gather variables
-                subst = rule.gather_var_assignment()
-                # ground corresponding chi literal
-                ground_chi_literal = chi_literal.substitute(subst)
-
-                if ground_chi_literal not in self.instance_map:
-                    self.instance_map[ground_chi_literal] = (
-                        set(),
-                        tuple(
-                            guard.substitute(subst) if guard is not None else None
-                            for guard in choice.guards
-                        ),
-                    )
+            # skip instances from previous iterations (already accounted for)
+            if rule in self.processed_instances:
+                continue
+
+            self.processed_instances.add(rule)
 
-                self.instance_map[ground_chi_literal][0].add(
-                    rule.element.substitute(subst)
+            info = choice_info.get(rule.ref_id)
+
+            if info is None:
+                # get corresponding chi_literal
+                choice, chi_literal, *_ = self.choice_map[rule.ref_id]
+                # guards without variables can be shared by all instances
+                static_guards = all(
+                    guard is None or guard.ground for guard in choice.guards
                 )
 
+                info = choice_info[rule.ref_id] = (choice, chi_literal, static_guards)
+
+            choice, chi_literal, static_guards = info
+
+            # gather variable substitution
+            subst = rule.gather_var_assignment()
+            # ground corresponding chi literal
+            ground_chi_literal = chi_literal.substitute(subst)
+
+            ground_elements = self.elements_map.get(ground_chi_literal)
+
+            if ground_elements is None:
+                if static_guards:
+                    ground_guards = choice.guards
+                else:
+                    ground_guards = tuple(
+                        guard.substitute(subst) if guard is not None else None
+                        for guard in choice.guards
+                    )
+
+                ground_elements = self.elements_map[ground_chi_literal] = set()
+                self.guards_map[ground_chi_literal] = ground_guards
+
+            if isinstance(rule, ChoiceElemRule):
+                ground_elements.add(rule.element.substitute(subst))
+
         possible_chi_literals = set()
 
-        for ground_chi_literal, (
-            ground_elements,
-            ground_guards,
-        ) in self.instance_map.items():
+        for ground_chi_literal, ground_elements in self.elements_map.items():
             # skip chi literal if already derived (in previous iteration)
             if ground_chi_literal in literals_J_chi:
                 possible_chi_literals.add(ground_chi_literal)
                 continue
 
+            # get corresponding choice expression
+            choice, *_ = self.choice_map[ground_chi_literal.ref_id]
+
             # propagate choice to check satisfiability
-            # TODO: choice.propagate
             satisfiable = choice.propagate(
-                ground_guards, ground_elements, literals_I, literals_J
+                self.guards_map[ground_chi_literal],
+                ground_elements,
+                literals_I,
+                literals_J,
             )
 
             if satisfiable:
@@ -94,15 +109,22 @@ class ChoicePropagator:
         # map ground chi literals to corresponding
         # assembled choice expressions to be replaced with
         assembling_map = {
-            chi_literal: Choice(tuple(elements), guards)
-            for chi_literal, (
-                elements,
-                guards,
-            ) in self.instance_map.items()
+            chi_literal: Choice(tuple(elements), self.guards_map[chi_literal])
+            for chi_literal, elements in self.elements_map.items()
             if chi_literal in satisfiable
         }
 
+        assembled_statements = set()
+
+        for statement in statements:
+            # only rules deriving chi literals need to be assembled
+            if any(
+                isinstance(literal, ChoicePlaceholder)
+                for literal in statement.consequents()
+            ):
+                statement = statement.assemble_choices(assembling_map)
+
+            assembled_statements.add(statement)
+
         # return assembled rules
-        return set(
-            statement.assemble_choices(assembling_map) for statement in statements
-        )
+        return assembled_statements
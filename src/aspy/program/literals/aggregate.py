@@ -5,6 +5,7 @@ from itertools import chain, combinations
 from typing import (
     TYPE_CHECKING,
     Any,
+    FrozenSet,
     Iterable,
     Iterator,
     Optional,
@@ -75,7 +76,7 @@ class AggrElement(Expr):
         self.literals = (
             literals
             if isinstance(literals, LiteralCollection)
-            else LiteralCollection(*literals)
+            else LiteralCollection.from_iterable(literals)
         )
 
     def __eq__(self: Self, other: "Any") -> bool:
@@ -89,13 +90,19 @@ class AggrElement(Expr):
         Returns:
             Boolean indicating whether or not the element is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, AggrElement)
+            and self._hash == other._hash
             and self.terms == other.terms
             and self.literals == other.literals
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
+        # terms and literals are never modified (hash can be computed once)
         return hash(("aggr element", self.terms, self.literals))
 
     def __str__(self: Self) -> str:
@@ -106,10 +113,8 @@ class AggrElement(Expr):
             Represents literals and terms separated by commas, respectively and joined with a colon.
             If the element has no literals, the colon is omitted.
         """  # noqa
-        return ",".join([str(term) for term in self.terms]) + (
-            f":{','.join([str(literal) for literal in self.literals])}"
-            if self.literals
-            else ""
+        return ",".join(map(str, self.terms)) + (
+            f":{','.join(map(str, self.literals))}" if self.literals else ""
         )
 
     @property
@@ -1097,8 +1102,11 @@ class AggrLiteral(Literal):
         naf: Boolean indicating whether or not the aggregate literal is default-negated.
         ground: Boolean indicating whether or not the aggregate literal is ground.
             The literal is considered ground if all guards and elements are ground.
+        is_aggr: Boolean indicating whether or not the literal is an aggregate literal.
     """  # noqa
 
+    is_aggr = True
+
     def __init__(
         self: Self,
         func: AggrFunc,
@@ -1161,7 +1169,7 @@ class AggrLiteral(Literal):
             and enclosed in curly braces.
             Guard representations precede or succeed the string if specified.
         """  # noqa
-        elements_str = ";".join([str(element) for element in self.elements])
+        elements_str = ";".join(map(str, self.elements))
         lguard_str = f"{str(self.lguard)} " if self.lguard is not None else ""
         rguard_str = f" {str(self.rguard)}" if self.rguard is not None else ""
 
@@ -1181,15 +1189,26 @@ class AggrLiteral(Literal):
         Returns:
             Boolean indicating whether or not the literal is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, AggrLiteral)
+            and self._hash == other._hash
             and self.func == other.func
-            and set(self.elements) == set(other.elements)
+            and self._element_set == other._element_set
             and self.guards == other.guards
         )
 
     def __hash__(self) -> int:
-        return hash(("aggr literal", self.func, self.elements, self.guards))
+        return self._hash
+
+    @cached_property
+    def _element_set(self) -> FrozenSet[AggrElement]:
+        # elements are never modified (set can be computed once)
+        return frozenset(self.elements)
+
+    @cached_property
+    def _hash(self) -> int:
+        # NOTE: hashes the set of elements (consistent with equality)
+        return hash(("aggr literal", self.func, self._element_set, self.guards))
 
     @cached_property
     def ground(self) -> bool:
@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional, Self, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, FrozenSet, Optional, Self, Set, Tuple, Union
 
 from aspy.program.operators import RelOp
 from aspy.program.safety_characterization import SafetyRule, SafetyTriplet
@@ -29,8 +28,11 @@ class BuiltinLiteral(Literal, ABC):
         naf: Boolean indicating whether or not the literal is default-negated
             (always `False` for built-in literals).
         ground: Boolean indicating whether or not the literal is ground.
+        is_builtin: Boolean indicating whether or not the literal is a built-in literal.
     """
 
+    is_builtin = True
+
     def __init__(self: Self, loperand: "Term", roperand: "Term") -> None:
         """Initializes built-in literal instance.
 
@@ -70,7 +72,12 @@ class BuiltinLiteral(Literal, ABC):
         Returns:
             (Possibly empty) set of `Variable` instances as union of the variables of both operands.
         """  # noqa
-        return self.loperand.vars().union(self.roperand.vars())
+        return set(self._vars)
+
+    @cached_property
+    def _vars(self: Self) -> FrozenSet["Variable"]:
+        # operands are never modified (variables can be computed once)
+        return frozenset(self.loperand.vars().union(self.roperand.vars()))
 
     def safety(
         self: Self, statement: Optional[Union["Statement", "Query"]] = None
@@ -127,8 +134,10 @@ class BuiltinLiteral(Literal, ABC):
         Returns:
             `BuiltinLiteral` instance with (possibly substituted) operands.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground literals are not affected by substitutions (and never modified)
+        # and neither are literals whose variables are not substituted
+        if self.ground or subst.keys().isdisjoint(self._vars):
+            return self
 
         # substitute operands recursively
         operands = (operand.substitute(subst) for operand in self.operands)
@@ -200,8 +209,12 @@ class Equal(BuiltinLiteral):
         lsafety = self.loperand.safety()
         rsafety = self.roperand.safety()
 
-        rules = {SafetyRule(var, lvars.copy()) for var in rsafety.safe}.union(
-            {SafetyRule(var, rvars.copy()) for var in lsafety.safe}
+        # NOTE: safety rules store (and share) frozen copies of the dependees
+        lvars_frozen = frozenset(lvars)
+        rvars_frozen = frozenset(rvars)
+
+        rules = {SafetyRule(var, lvars_frozen) for var in rsafety.safe}.union(
+            {SafetyRule(var, rvars_frozen) for var in lsafety.safe}
         )
 
         return SafetyTriplet(unsafe=lvars.union(rvars), rules=rules).normalize()
@@ -247,7 +260,9 @@ class Equal(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, Equal):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
@@ -332,7 +347,9 @@ class Unequal(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, Unequal):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
@@ -417,7 +434,9 @@ class Less(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, Less):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
@@ -502,7 +521,9 @@ class Greater(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, Greater):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
@@ -587,7 +608,9 @@ class LessEqual(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, LessEqual):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
@@ -672,7 +695,9 @@ class GreaterEqual(BuiltinLiteral):
             A substitution necessary for matching (may be empty) or `None` if cannot be matched.
         """  # noqa
         if isinstance(other, GreaterEqual):
-            return TermTuple(*self.operands).match(TermTuple(*other.operands))
+            return TermTuple.from_tuple(self.operands).match(
+                TermTuple.from_tuple(other.operands)
+            )
 
         return None
 
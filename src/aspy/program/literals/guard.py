@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Self, Set, Union
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -64,7 +63,8 @@ class Guard(NamedTuple):
         )
 
     def __hash__(self: Self) -> int:
-        return hash(("guard", self.op, self.bound, self.right))
+        # hash right-hand side equivalent (consistent with equality across sides)
+        return hash(("guard", self.op if self.right else -self.op, self.bound))
 
     def to_left(self: Self) -> "Guard":
         """Moves guard to the left-hand side.
@@ -74,7 +74,8 @@ class Guard(NamedTuple):
         """
         if self.right:
             return Guard(-self.op, self.bound, False)
-        return deepcopy(self)
+        # guards are immutable (no need to copy)
+        return self
 
     def to_right(self: Self) -> "Guard":
         """Moves guard to the right-hand side.
@@ -84,7 +85,8 @@ class Guard(NamedTuple):
         """
         if not self.right:
             return Guard(-self.op, self.bound, True)
-        return deepcopy(self)
+        # guards are immutable (no need to copy)
+        return self
 
     def vars(self: Self) -> Set["Variable"]:
         """Returns the variables associated with the guard.
@@ -139,6 +141,10 @@ class Guard(NamedTuple):
         Returns:
             `Guard` instance with (possibly substituted) bound term.
         """
+        # ground guards are not affected by substitutions (and never modified)
+        if self.ground:
+            return self
+
         return Guard(self.op, self.bound.substitute(subst), self.right)
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "Guard":
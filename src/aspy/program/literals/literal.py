@@ -3,7 +3,19 @@ from abc import ABC, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterator, Optional, Self, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from aspy.program.expression import Expr
 from aspy.program.safety_characterization import SafetyTriplet
@@ -26,9 +38,15 @@ class Literal(Expr, ABC):
     Attributes:
         naf: Boolean indicating whether or not the literal is default-negated.
         ground: Boolean indicating whether or not the literal is ground.
+        is_pred: Boolean indicating whether or not the literal is a predicate literal.
+        is_builtin: Boolean indicating whether or not the literal is a built-in literal.
+        is_aggr: Boolean indicating whether or not the literal is an aggregate literal.
     """
 
     naf: bool = False
+    is_pred = False
+    is_builtin = False
+    is_aggr = False
 
     @abstractmethod  # pragma: no cover
     def pos_occ(self) -> "LiteralCollection":
@@ -123,6 +141,30 @@ class LiteralCollection:
         ground: Boolean indicating whether or not all literals are ground.
     """
 
+    __empty = None
+
+    def __new__(
+        cls: Type["LiteralCollection"], *literals: Literal
+    ) -> "LiteralCollection":
+        """Returns a new literal collection or the shared empty one.
+
+        Literal collections are never modified, so a single empty instance is created
+        and reused.
+
+        Args:
+            *literals: Sequence of `Literal` instances.
+
+        Returns:
+            `LiteralCollection` instance.
+        """
+        if literals:
+            return super().__new__(cls)
+
+        if cls.__empty is None:
+            cls.__empty = super().__new__(cls)
+
+        return cls.__empty
+
     def __init__(self: Self, *literals: Literal) -> None:
         """Initializes literal collection instance.
 
@@ -133,6 +175,36 @@ class LiteralCollection:
         # initialize while removing duplicates and preserving order
         self.literals = tuple(dict.fromkeys(literals))
 
+    @classmethod
+    def from_iterable(
+        cls: Type["LiteralCollection"], literals: Iterable[Literal]
+    ) -> "LiteralCollection":
+        """Creates a literal collection from an iterable over literals.
+
+        Avoids the copy caused by unpacking the literals as positional arguments.
+
+        Args:
+            literals: Iterable over `Literal` instances.
+
+        Returns:
+            `LiteralCollection` instance.
+        """
+        # remove duplicates while preserving order
+        literals = tuple(dict.fromkeys(literals))
+
+        # empty collections are shared
+        if not literals:
+            return cls()
+
+        collection = object.__new__(cls)
+        collection.literals = literals
+
+        return collection
+
+    def __getnewargs__(self: Self) -> Tuple[Literal, ...]:
+        # passed to '__new__' on unpickling (empty collections stay shared)
+        return self.literals
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the literal collection.
 
@@ -140,7 +212,7 @@ class LiteralCollection:
             String consisting of the string representations of the literals,
             seperated by commas.
         """  # noqa
-        return f"{','.join(str(literal) for literal in self.literals)}"
+        return f"{','.join(map(str, self.literals))}"
 
     def __len__(self: Self) -> int:
         return len(self.literals)
@@ -157,14 +229,28 @@ class LiteralCollection:
         Returns:
             Boolean indicating whether or not the literal collection is considered equal to the given object.
         """  # noqa
+        # identical or differently hashed collections need no element-wise comparison
+        if self is other:
+            return True
+
         return (
             isinstance(other, LiteralCollection)
             and len(self) == len(other)
-            and frozenset(self.literals) == frozenset(other.literals)
+            and self._hash == other._hash
+            and self._literal_set == other._literal_set
         )
 
     def __hash__(self: Self) -> int:
-        return hash(("literal collection", frozenset(self.literals)))
+        return self._hash
+
+    @cached_property
+    def _literal_set(self: Self) -> FrozenSet[Literal]:
+        # literals are never modified (set can be computed once)
+        return frozenset(self.literals)
+
+    @cached_property
+    def _hash(self: Self) -> int:
+        return hash(("literal collection", self._literal_set))
 
     def __iter__(self: Self) -> Iterator[Literal]:
         return iter(self.literals)
@@ -177,33 +263,33 @@ class LiteralCollection:
 
     def __lt__(self: Self, other: Union["LiteralCollection", Set["Literal"]]) -> bool:
         if isinstance(other, set):
-            return set(self.literals) < other
+            return self._literal_set < other
         elif isinstance(other, LiteralCollection):
-            return set(self.literals) < set(other.literals)
+            return self._literal_set < other._literal_set
 
         return False
 
     def __gt__(self: Self, other: Union["LiteralCollection", Set["Literal"]]) -> bool:
         if isinstance(other, set):
-            return set(self.literals) > other
+            return self._literal_set > other
         elif isinstance(other, LiteralCollection):
-            return set(self.literals) > set(other.literals)
+            return self._literal_set > other._literal_set
 
         return False
 
     def __le__(self: Self, other: Union["LiteralCollection", Set["Literal"]]) -> bool:
         if isinstance(other, set):
-            return set(self.literals) <= other
+            return self._literal_set <= other
         elif isinstance(other, LiteralCollection):
-            return set(self.literals) <= set(other.literals)
+            return self._literal_set <= other._literal_set
 
         return False
 
     def __ge__(self: Self, other: Union["LiteralCollection", Set["Literal"]]) -> bool:
         if isinstance(other, set):
-            return set(self.literals) >= other
+            return self._literal_set >= other
         elif isinstance(other, LiteralCollection):
-            return set(self.literals) >= set(other.literals)
+            return self._literal_set >= other._literal_set
 
         return False
 
@@ -211,25 +297,37 @@ class LiteralCollection:
     def ground(self: Self) -> bool:
         return all(literal.ground for literal in self.literals)
 
+    @cached_property
+    def _pos_occ(self: Self) -> "LiteralCollection":
+        return LiteralCollection(
+            *itertools.chain(*tuple(literal.pos_occ() for literal in self.literals))
+        )
+
+    @cached_property
+    def _neg_occ(self: Self) -> "LiteralCollection":
+        return LiteralCollection(
+            *itertools.chain(*tuple(literal.neg_occ() for literal in self.literals))
+        )
+
     def pos_occ(self: Self) -> "LiteralCollection":
         """Positive literal occurrences.
 
+        Computed once per literal collection and cached afterwards.
+
         Returns:
             Union of the sets of `Literal` instances that occur positively in the literals.
         """  # noqa
-        return LiteralCollection(
-            *itertools.chain(*tuple(literal.pos_occ() for literal in self.literals))
-        )
+        return self._pos_occ
 
     def neg_occ(self: Self) -> "LiteralCollection":
         """Negative literal occurrences.
 
+        Computed once per literal collection and cached afterwards.
+
         Returns:
             Union of the sets of `Literal` instances that occur negatively in the literals.
         """  # noqa
-        return LiteralCollection(
-            *itertools.chain(*tuple(literal.neg_occ() for literal in self.literals))
-        )
+        return self._neg_occ
 
     def vars(self: Self) -> Set["Variable"]:
         """Returns the variables associated with the literal collection.
@@ -237,7 +335,12 @@ class LiteralCollection:
         Returns:
             (Possibly empty) set of `Variable` instances as union of the variables of all literals.
         """  # noqa
-        return set().union(*tuple(literal.vars() for literal in self.literals))
+        return set(self._vars)
+
+    @cached_property
+    def _vars(self: Self) -> FrozenSet["Variable"]:
+        # literals are never modified (variables can be computed once)
+        return frozenset().union(*[literal.vars() for literal in self.literals])
 
     def global_vars(
         self: Self, statement: Optional["Statement"] = None
@@ -293,13 +396,16 @@ class LiteralCollection:
         Returns:
             `LiteralCollection` instance with (possibly substituted) literals.
         """
-        if self.ground:
-            return deepcopy(self)
-
-        # substitute literals recursively
-        literals = (literal.substitute(subst) for literal in self)
-
-        return LiteralCollection(*literals)
+        # ground literal collections are not affected by substitutions
+        # and neither are collections whose variables are not substituted
+        if self.ground or subst.keys().isdisjoint(self._vars):
+            return self
+
+        # substitute non-ground literals recursively (ground ones are kept as is)
+        return LiteralCollection.from_iterable(
+            literal if literal.ground else literal.substitute(subst)
+            for literal in self.literals
+        )
 
     def match(self: Self, other: "Expr") -> Optional["Substitution"]:
         """Tries to match the literal collection with an expression.
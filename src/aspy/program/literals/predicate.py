@@ -1,6 +1,5 @@
-from copy import deepcopy
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional, Self, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, FrozenSet, Optional, Self, Set, Tuple, Union
 
 import aspy
 from aspy.program.safety_characterization import SafetyTriplet
@@ -28,8 +27,11 @@ class PredLiteral(Literal):
         naf: Boolean indicating whether or not the literal is default-negated.
         ground: Boolean indicating whether or not all terms are ground.
         arity: Integer representing the arity of the functional term (equal to the number of terms).
+        is_pred: Boolean indicating whether or not the literal is a predicate literal.
     """  # noqa
 
+    is_pred = True
+
     def __init__(
         self,
         name: str,
@@ -59,7 +61,7 @@ class PredLiteral(Literal):
 
         self.name = name
         self.neg = neg
-        self.terms = TermTuple(*terms)
+        self.terms = TermTuple.from_tuple(terms)
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the literal to a given object.
@@ -95,9 +97,7 @@ class PredLiteral(Literal):
             seperated by commas and enclosed by parentheses.
             If the predicate literal has no terms, the parentheses are omitted.
         """  # noqa
-        terms_str = (
-            f"({','.join([str(term) for term in self.terms])})" if self.terms else ""
-        )
+        terms_str = f"({str(self.terms)})" if self.terms else ""
         return f"{('not ' if self.naf else '')}{('-' if self.neg else '')}{self.name}{terms_str}"  # noqa
 
     @property
@@ -168,7 +168,12 @@ class PredLiteral(Literal):
         Returns:
             (Possibly empty) set of `Variable` instances as union of the variables of all terms.
         """  # noqa
-        return set().union(self.terms.vars())
+        return set(self._vars)
+
+    @cached_property
+    def _vars(self: Self) -> FrozenSet["Variable"]:
+        # terms are never modified (variables can be computed once)
+        return frozenset(self.terms.vars())
 
     def safety(
         self: Self, statement: Optional[Union["Statement", "Query"]] = None
@@ -225,13 +230,15 @@ class PredLiteral(Literal):
         Returns:
             `PredicateLiteral` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground literals are not affected by substitutions (and never modified)
+        # and neither are literals whose variables are not substituted
+        if self.ground or subst.keys().isdisjoint(self._vars):
+            return self
 
         # substitute terms recursively
         return PredLiteral(
             self.name,
-            *tuple((term.substitute(subst) for term in self.terms)),
+            *self.terms.substitute(subst).terms,
             neg=self.neg,
             naf=self.naf,
         )
@@ -1,5 +1,4 @@
 from abc import ABC
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Self
 
 from aspy.program.literals import LiteralCollection, PredLiteral
@@ -165,15 +164,16 @@ class PropPlaceholder(AuxLiteral):
         Returns:
             `PropPlaceholder` instance with (possibly substituted) terms.
         """
+        # ground literals are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         # substitute terms recursively
         return type(self)(
             prefix=self.prefix,
             ref_id=self.ref_id,
             glob_vars=self.glob_vars,
-            terms=TermTuple(*tuple(term.substitute(subst) for term in self.terms)),
+            terms=self.terms.substitute(subst),
             naf=self.naf,
         )
 
@@ -344,15 +344,16 @@ class PropBaseLiteral(AuxLiteral):
         Returns:
             `PropBaseLiteral` instance with (possibly substituted) terms.
         """
+        # ground literals are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         # substitute terms recursively
         return type(self)(
             prefix=self.prefix,
             ref_id=self.ref_id,
             glob_vars=self.glob_vars,
-            terms=TermTuple(*tuple((term.substitute(subst) for term in self.terms))),
+            terms=self.terms.substitute(subst),
         )
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "PropBaseLiteral":
@@ -544,8 +545,9 @@ class PropElemLiteral(AuxLiteral):
         Returns:
             `PropElemLiteral` instance with (possibly substituted) terms.
         """
+        # ground literals are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -554,7 +556,7 @@ class PropElemLiteral(AuxLiteral):
             element_id=self.element_id,
             local_vars=self.local_vars,
             glob_vars=self.glob_vars,
-            terms=TermTuple(*tuple(term.substitute(subst) for term in self.terms)),
+            terms=self.terms.substitute(subst),
         )
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "PropElemLiteral":
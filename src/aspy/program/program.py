@@ -76,7 +76,7 @@ class Program:
             Contains the string representations of all statements and the query
             on separate lines in order.
         """
-        return "\n".join([str(statement) for statement in self.statements]) + (
+        return "\n".join(map(str, self.statements)) + (
             "\n" + str(self.query) if self.query is not None else ""
         )
 
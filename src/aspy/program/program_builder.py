@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, List, Optional, Self, Tuple, Union
+import sys
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Self, Tuple, Union
 
 import antlr4  # type: ignore
 
@@ -44,6 +45,12 @@ if TYPE_CHECKING:  # pragma: no cover
     from aspy.program.literals import BuiltinLiteral, Literal
     from aspy.program.terms import Term
 
+# map operator token types directly to the corresponding operators/classes
+token2relop = {getattr(ASPCore2Parser, op.name): op for op in RelOp}
+token2rel = {getattr(ASPCore2Parser, op.name): op2rel[op] for op in RelOp}
+token2arith = {getattr(ASPCore2Parser, op.name): op2arith[op] for op in ArithOp}
+token2aggrop = {getattr(ASPCore2Parser, op.name): op for op in AggrOp}
+
 
 class ProgramBuilder(ASPCore2Visitor):
     """Builds Answer Set program from ANTLR4 parse tree.
@@ -61,6 +68,56 @@ class ProgramBuilder(ASPCore2Visitor):
                 arithmetic terms while building the program. Defaults to `True`.
         """
         self.simplify_arithmetic = simplify_arithmetic
+        # variable table (for special counters; reset for each statement)
+        self.var_table = VariableTable()
+
+    def visit(self: Self, tree: antlr4.ParserRuleContext) -> Any:
+        """Visits a parse tree.
+
+        Dispatches directly to the visitor method corresponding to the type of
+        the context (instead of resolving it via the context's `accept` method).
+
+        Args:
+            tree: `antlr4.ParserRuleContext` to be visited.
+
+        Returns:
+            Result of the corresponding visitor method.
+        """
+        return self.dispatch_map[type(tree)](self, tree)
+
+    def _collect(
+        self: Self,
+        ctx: antlr4.ParserRuleContext,
+        visit_element: Callable[[antlr4.ParserRuleContext], Any],
+    ) -> List[Any]:
+        """Collects the elements of a right-recursive list rule.
+
+        Handles rules of the form:
+            elements            :   element (SEPARATOR elements)?
+
+        The tail of the list is walked iteratively instead of recursively.
+
+        Args:
+            ctx: `antlr4.ParserRuleContext` of the list rule to be visited.
+            visit_element: Visitor method to be called for each element context.
+
+        Returns:
+            List of visited elements.
+        """
+        elements = []
+
+        while True:
+            # element
+            elements.append(visit_element(ctx.children[0]))
+
+            # SEPARATOR elements
+            if len(ctx.children) == 1:
+                break
+
+            # continue with tail
+            ctx = ctx.children[2]
+
+        return elements
 
     # Visit a parse tree produced by ASPCore2Parser#program.
     def visitProgram(
@@ -77,10 +134,10 @@ class ProgramBuilder(ASPCore2Visitor):
 
         for child in ctx.children[:-1]:
             # statements
-            if isinstance(child, ASPCore2Parser.StatementsContext):
+            if type(child) is ASPCore2Parser.StatementsContext:
                 statements += self.visitStatements(child)
             # query
-            elif isinstance(child, ASPCore2Parser.QueryContext):
+            elif type(child) is ASPCore2Parser.QueryContext:
                 query = self.visitQuery(child)
 
         return (statements, query)
@@ -132,8 +189,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `Statement` instance.
         """  # noqa
-        # initialize empty variable table (for special counters)
-        self.var_table = VariableTable()
+        # reset variable table (for special counters)
+        self.var_table.reset()
 
         n_children = len(ctx.children)
 
@@ -141,11 +198,11 @@ class ProgramBuilder(ASPCore2Visitor):
         # CONS body? DOT (i.e., constraint)
         if isinstance(ctx.children[0], antlr4.tree.Tree.TerminalNode):
             # get token
-            token = ctx.children[0].getSymbol()
-            token_type = ASPCore2Parser.symbolicNames[token.type]
+            token = ctx.children[0].symbol
+            token_type = token.type
 
             # CONS body? DOT (i.e., constraint)
-            if token_type == "CONS":
+            if token_type == ASPCore2Parser.CONS:
                 # body
                 if n_children > 2:
                     statement = Constraint(*self.visitBody(ctx.children[1]))
@@ -196,12 +253,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `Choice` instance or tuple of `PredicateLiteral` instances.
         """
-        # disjunction
-        if isinstance(ctx.children[0], ASPCore2Parser.DisjunctionContext):
-            return self.visitDisjunction(ctx.children[0])
-        # choice
-        else:
-            return self.visitChoice(ctx.children[0])
+        # disjunction | choice
+        return self.dispatch_map[type(ctx.children[0])](self, ctx.children[0])
 
     # Visit a parse tree produced by ASPCore2Parser#body.
     def visitBody(self: Self, ctx: ASPCore2Parser.BodyContext) -> Tuple["Literal", ...]:
@@ -216,20 +269,25 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             Tuple of `Literal` instances.
         """
-        # naf_literal
-        if isinstance(ctx.children[0], ASPCore2Parser.Naf_literalContext):
-            literals = tuple([self.visitNaf_literal(ctx.children[0])])
-        # NAF aggregate
-        elif isinstance(ctx.children[0], antlr4.tree.Tree.TerminalNode):
-            literals = tuple([Naf(self.visitAggregate(ctx.children[1]))])
-        # aggregate
-        else:
-            literals = tuple([self.visitAggregate(ctx.children[0])])
+        literals = []
+
+        while True:
+            # naf_literal
+            if type(ctx.children[0]) is ASPCore2Parser.Naf_literalContext:
+                literals.append(self.visitNaf_literal(ctx.children[0]))
+            # NAF aggregate
+            elif isinstance(ctx.children[0], antlr4.tree.Tree.TerminalNode):
+                literals.append(Naf(self.visitAggregate(ctx.children[1])))
+            # aggregate
+            else:
+                literals.append(self.visitAggregate(ctx.children[0]))
 
-        # COMMA body
-        if len(ctx.children) > 2:
-            # append literals
-            literals += self.visitBody(ctx.children[-1])
+            # COMMA body
+            if type(ctx.children[-1]) is not ASPCore2Parser.BodyContext:
+                break
+
+            # continue with tail (iteratively instead of recursively)
+            ctx = ctx.children[-1]
 
         return tuple(literals)
 
@@ -248,15 +306,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             List of `PredicateLiteral` instances.
         """
-        # classical_literal
-        literals = [self.visitClassical_literal(ctx.children[0])]
-
-        # OR disjunction
-        if len(ctx.children) > 1:
-            # append literals
-            literals += self.visitDisjunction(ctx.children[2])
-
-        return literals
+        # classical_literal (OR disjunction)?
+        return self._collect(ctx, self.visitClassical_literal)
 
     # Visit a parse tree produced by ASPCore2Parser#choice.
     def visitChoice(self: Self, ctx: ASPCore2Parser.ChoiceContext) -> Choice:
@@ -275,9 +326,9 @@ class ProgramBuilder(ASPCore2Visitor):
         lguard, rguard = None, None
 
         # term relop
-        if isinstance(ctx.children[0], ASPCore2Parser.TermContext):
+        if type(ctx.children[0]) is ASPCore2Parser.TermContext:
             lguard = Guard(
-                self.visitRelop(ctx.children[1]),
+                token2relop[ctx.children[1].children[0].symbol.type],
                 self.visitTerm(ctx.children[0]),
                 False,
             )
@@ -297,7 +348,7 @@ class ProgramBuilder(ASPCore2Visitor):
         # relop term
         if moving_index < len(ctx.children) - 1:
             rguard = Guard(
-                self.visitRelop(ctx.children[moving_index]),
+                token2relop[ctx.children[moving_index].children[0].symbol.type],
                 self.visitTerm(ctx.children[moving_index + 1]),
                 True,
             )
@@ -319,15 +370,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             Tuple of `ChoiceElement` instances.
         """
-        # choice_element
-        elements = tuple([self.visitChoice_element(ctx.children[0])])
-
-        # SEMICOLON choice_elements
-        if len(ctx.children) > 1:
-            # append literals
-            elements += self.visitChoice_elements(ctx.children[2])
-
-        return elements
+        # choice_element (SEMICOLON choice_elements)?
+        return tuple(self._collect(ctx, self.visitChoice_element))
 
     # Visit a parse tree produced by ASPCore2Parser#choice_element.
     def visitChoice_element(
@@ -375,9 +419,11 @@ class ProgramBuilder(ASPCore2Visitor):
         lguard, rguard = None, None
 
         # term relop
-        if isinstance(ctx.children[0], ASPCore2Parser.TermContext):
+        if type(ctx.children[0]) is ASPCore2Parser.TermContext:
             lguard = Guard(
-                self.visitRelop(ctx.children[1]), self.visitTerm(ctx.children[0]), False
+                token2relop[ctx.children[1].children[0].symbol.type],
+                self.visitTerm(ctx.children[0]),
+                False,
             )
             moving_index += 2  # should now point to 'aggregate_function'
 
@@ -397,7 +443,7 @@ class ProgramBuilder(ASPCore2Visitor):
         # relop term
         if moving_index < len(ctx.children) - 1:
             rguard = Guard(
-                self.visitRelop(ctx.children[moving_index]),
+                token2relop[ctx.children[moving_index].children[0].symbol.type],
                 self.visitTerm(ctx.children[moving_index + 1]),
                 True,
             )
@@ -419,16 +465,11 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             Tuple of `AggrElement` instances.
         """
-        # aggregate_element
-        element = self.visitAggregate_element(ctx.children[0])
-        elements = tuple([element]) if element is not None else tuple()
+        # aggregate_element (SEMICOLON aggregate_elements)?
+        elements = self._collect(ctx, self.visitAggregate_element)
 
-        # SEMICOLON aggregate_elements
-        if len(ctx.children) > 1:
-            # append literals
-            elements += self.visitAggregate_elements(ctx.children[2])
-
-        return elements
+        # filter out empty elements
+        return tuple(element for element in elements if element is not None)
 
     # Visit a parse tree produced by ASPCore2Parser#aggregate_element.
     def visitAggregate_element(
@@ -451,21 +492,23 @@ class ProgramBuilder(ASPCore2Visitor):
         # terms
         terms = (
             self.visitTerms(ctx.children[0])
-            if isinstance(ctx.children[0], ASPCore2Parser.TermsContext)
+            if type(ctx.children[0]) is ASPCore2Parser.TermsContext
             else tuple()
         )
 
         # literals
         literals = (
             self.visitNaf_literals(ctx.children[-1])
-            if isinstance(ctx.children[-1], ASPCore2Parser.Naf_literalsContext)
+            if type(ctx.children[-1]) is ASPCore2Parser.Naf_literalsContext
             else tuple()
         )
 
         if not terms and not literals:
             return None
         else:
-            return AggrElement(TermTuple(*terms), LiteralCollection(*literals))
+            return AggrElement(
+                TermTuple.from_tuple(terms), LiteralCollection.from_iterable(literals)
+            )
 
     # Visit a parse tree produced by ASPCore2Parser#aggregate_function.
     def visitAggregate_function(
@@ -486,9 +529,9 @@ class ProgramBuilder(ASPCore2Visitor):
             `AggrOp` instance.
         """
         # get token
-        token = ctx.children[0].getSymbol()
+        token = ctx.children[0].symbol
 
-        return AggrOp(token.text)
+        return token2aggrop[token.type]
 
     # Visit a parse tree produced by ASPCore2Parser#weight_at_level.
     def visitWeight_at_level(
@@ -512,13 +555,13 @@ class ProgramBuilder(ASPCore2Visitor):
 
         if len(ctx.children) > 0:
             # get next token
-            token = ctx.children[1].getSymbol()
-            token_type = ASPCore2Parser.symbolicNames[token.type]
+            token = ctx.children[1].symbol
+            token_type = token.type
 
             moving_index = 2
 
             # AT term
-            if token_type == "AT":
+            if token_type == ASPCore2Parser.AT:
                 level = self.visitTerm(ctx.children[moving_index])
                 moving_index += 2
             else:
@@ -550,15 +593,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             Tuple of `Literal` instances.
         """
-        # naf_literal
-        literals = tuple([self.visitNaf_literal(ctx.children[0])])
-
-        # COMMA naf_literals
-        if len(ctx.children) > 1:
-            # append literals
-            literals += self.visitNaf_literals(ctx.children[2])
-
-        return literals
+        # naf_literal (COMMA naf_literals)?
+        return tuple(self._collect(ctx, self.visitNaf_literal))
 
     # Visit a parse tree produced by ASPCore2Parser#naf_literal.
     def visitNaf_literal(
@@ -572,7 +608,7 @@ class ProgramBuilder(ASPCore2Visitor):
                                 |   builtin_atom ;
         """
         # builtin_atom
-        if isinstance(ctx.children[0], ASPCore2Parser.Builtin_atomContext):
+        if type(ctx.children[0]) is ASPCore2Parser.Builtin_atomContext:
             return self.visitBuiltin_atom(ctx.children[0])
         # NAF? classical_literal
         else:
@@ -603,11 +639,11 @@ class ProgramBuilder(ASPCore2Visitor):
         n_children = len(ctx.children)
 
         # get first token
-        token = ctx.children[0].getSymbol()
-        token_type = ASPCore2Parser.symbolicNames[token.type]
+        token = ctx.children[0].symbol
+        token_type = token.type
 
         # MINUS ID (true) or ID (false)
-        minus = True if (token_type == "MINUS") else False
+        minus = True if (token_type == ASPCore2Parser.MINUS) else False
 
         # PAREN_OPEN terms PAREN_CLOSE
         if n_children - (minus + 1) > 2:
@@ -617,7 +653,10 @@ class ProgramBuilder(ASPCore2Visitor):
             # initialize empty term tuple
             terms = tuple()
 
-        return Neg(PredLiteral(ctx.children[minus].getSymbol().text, *terms), minus)
+        # intern predicate name (shared by all occurrences of the predicate)
+        name = sys.intern(ctx.children[minus].symbol.text)
+
+        return Neg(PredLiteral(name, *terms), minus)
 
     # Visit a parse tree produced by ASPCore2Parser#builtin_atom.
     def visitBuiltin_atom(
@@ -634,9 +673,10 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `BuiltinLiteral` instance.
         """
-        comp_op = self.visitRelop(ctx.children[1])
+        # get relop token
+        token = ctx.children[1].children[0].symbol
 
-        return op2rel[comp_op](
+        return token2rel[token.type](
             self.visitTerm(ctx.children[0]), self.visitTerm(ctx.children[2])
         )
 
@@ -659,9 +699,9 @@ class ProgramBuilder(ASPCore2Visitor):
             `RelOp` instance.
         """
         # get token
-        token = ctx.children[0].getSymbol()
+        token = ctx.children[0].symbol
 
-        return RelOp(token.text)
+        return token2relop[token.type]
 
     # Visit a parse tree produced by ASPCore2Parser#terms.
     def visitTerms(self: Self, ctx: ASPCore2Parser.TermsContext) -> Tuple["Term", ...]:
@@ -676,15 +716,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             Tuple of `Term` instances.
         """
-        # term
-        terms = tuple([self.visitTerm(ctx.children[0])])
-
-        # COMMA terms
-        if len(ctx.children) > 1:
-            # append terms
-            terms += self.visitTerms(ctx.children[2])
-
-        return terms
+        # term (COMMA terms)?
+        return tuple(self._collect(ctx, self.visitTerm))
 
     # Visit a parse tree produced by ASPCore2Parser#term.
     def visitTerm(self: Self, ctx: ASPCore2Parser.TermContext) -> "Term":
@@ -700,14 +733,40 @@ class ProgramBuilder(ASPCore2Visitor):
             `Term` instance.
         """
         # term_sum
-        term = self.visitTerm_sum(ctx.children[0])
+        term = self._visit_term_chain(ctx.children[0])
 
-        if isinstance(term, ArithTerm) and self.simplify_arithmetic:
+        if term.is_arith and self.simplify_arithmetic:
             # simplify arithmetic term
             term = term.simplify()
 
         return term
 
+    def _visit_term_chain(self: Self, ctx: ASPCore2Parser.Term_sumContext) -> "Term":
+        """Visits 'term_sum', skipping trivial intermediate contexts.
+
+        Single-child 'term_sum' and 'term_prod' contexts are passed through
+        directly to the visitor of the innermost non-trivial context.
+
+        Args:
+            ctx: `ASPCore2Parser.Term_sumContext` to be visited.
+
+        Returns:
+            `Term` instance.
+        """
+        # term_sum (PLUS | MINUS) term_prod
+        if len(ctx.children) > 1:
+            return self.visitTerm_sum(ctx)
+
+        # term_prod
+        ctx = ctx.children[0]
+
+        # term_prod (TIMES | DIV) term_atom
+        if len(ctx.children) > 1:
+            return self.visitTerm_prod(ctx)
+
+        # term_atom
+        return self.visitTerm_atom(ctx.children[0])
+
     # Visit a parse tree produced by ASPCore2Parser#term_sum.
     def visitTerm_sum(self: Self, ctx: ASPCore2Parser.Term_sumContext) -> "Term":
         """Visits 'term_sum'.
@@ -723,19 +782,23 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `Term` instance.
         """
+        operations = []
+
         # term_sum (PLUS | MINUS) term_prod
-        if len(ctx.children) > 1:
-            # get operator token
-            token = ctx.children[1].getSymbol()
+        while len(ctx.children) > 1:
+            # collect operator token and right operand (walking down left spine)
+            operations.append((ctx.children[1].symbol, ctx.children[2]))
+            ctx = ctx.children[0]
 
-            loperand = self.visitTerm_sum(ctx.children[0])
-            roperand = self.visitTerm_prod(ctx.children[2])
+        # term_prod
+        term = self.visitTerm_prod(ctx.children[0])
 
+        # fold operations from left to right
+        for token, roperand in reversed(operations):
             # PLUS | MINUS
-            return op2arith[ArithOp(token.text)](loperand, roperand)
-        # term_prod
-        else:
-            return self.visitTerm_prod(ctx.children[0])
+            term = token2arith[token.type](term, self.visitTerm_prod(roperand))
+
+        return term
 
     # Visit a parse tree produced by ASPCore2Parser#term_prod.
     def visitTerm_prod(self: Self, ctx: ASPCore2Parser.Term_prodContext) -> "Term":
@@ -752,19 +815,23 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `Term` instance.
         """
+        operations = []
+
         # term_prod (TIMES | DIV) term_atom
-        if len(ctx.children) > 1:
-            # get operator token
-            token = ctx.children[1].getSymbol()
+        while len(ctx.children) > 1:
+            # collect operator token and right operand (walking down left spine)
+            operations.append((ctx.children[1].symbol, ctx.children[2]))
+            ctx = ctx.children[0]
 
-            loperand = self.visitTerm_prod(ctx.children[0])
-            roperand = self.visitTerm_atom(ctx.children[2])
+        # term_atom
+        term = self.visitTerm_atom(ctx.children[0])
 
+        # fold operations from left to right
+        for token, roperand in reversed(operations):
             # TIMES | DIV
-            return op2arith[ArithOp(token.text)](loperand, roperand)
-        # term_atom
-        else:
-            return self.visitTerm_atom(ctx.children[0])
+            term = token2arith[token.type](term, self.visitTerm_atom(roperand))
+
+        return term
 
     # Visit a parse tree produced by ASPCore2Parser#Term_atom.
     def visitTerm_atom(self: Self, ctx: ASPCore2Parser.Term_atomContext) -> "Term":
@@ -788,28 +855,28 @@ class ProgramBuilder(ASPCore2Visitor):
         # first child is a token
         if isinstance(ctx.children[0], antlr4.tree.Tree.TerminalNode):
             # get token
-            token = ctx.children[0].getSymbol()
-            token_type = ASPCore2Parser.symbolicNames[token.type]
+            token = ctx.children[0].symbol
+            token_type = token.type
 
             # NUMBER
-            if token_type == "NUMBER":
+            if token_type == ASPCore2Parser.NUMBER:
                 return Number(int(token.text))
             # STRING
-            elif token_type == "STRING":
+            elif token_type == ASPCore2Parser.STRING:
                 return String(token.text[1:-1])
             # VARIABLE
-            elif token_type == "VARIABLE":
-                return self.var_table.create(token.text, register=False)
+            elif token_type == ASPCore2Parser.VARIABLE:
+                return self.var_table.create(sys.intern(token.text), register=False)
             # ANONYMOUS_VARIABLE
-            elif token_type == "ANONYMOUS_VARIABLE":
+            elif token_type == ASPCore2Parser.ANONYMOUS_VARIABLE:
                 return self.var_table.create(register=False)
             # PAREN_OPEN term PAREN_CLOSE
-            elif token_type == "PAREN_OPEN":
+            elif token_type == ASPCore2Parser.PAREN_OPEN:
                 # TODO: is (term) really identical to term?
                 return self.visitTerm(ctx.children[1])  # parse term
             # MINUS arith_atom
-            elif token_type == "MINUS":
-                term = self.visitTerm_sum(ctx.children[1])
+            elif token_type == ASPCore2Parser.MINUS:
+                term = self._visit_term_chain(ctx.children[1])
 
                 if not isinstance(term, (Number, ArithTerm)):
                     raise ValueError(
@@ -838,7 +905,8 @@ class ProgramBuilder(ASPCore2Visitor):
         Returns:
             `Term` instance.
         """
-        symbolic_id = ctx.children[0].getSymbol().text
+        # intern identifier (shared by all occurrences of the symbol)
+        symbolic_id = sys.intern(ctx.children[0].symbol.text)
 
         # ID
         if len(ctx.children) == 1:
@@ -853,3 +921,33 @@ class ProgramBuilder(ASPCore2Visitor):
 
             # return functional term
             return Functional(symbolic_id, *terms)
+
+    # map context types to corresponding visitor methods (for direct dispatch)
+    dispatch_map = {
+        ASPCore2Parser.ProgramContext: visitProgram,
+        ASPCore2Parser.StatementsContext: visitStatements,
+        ASPCore2Parser.QueryContext: visitQuery,
+        ASPCore2Parser.StatementContext: visitStatement,
+        ASPCore2Parser.HeadContext: visitHead,
+        ASPCore2Parser.BodyContext: visitBody,
+        ASPCore2Parser.DisjunctionContext: visitDisjunction,
+        ASPCore2Parser.ChoiceContext: visitChoice,
+        ASPCore2Parser.Choice_elementsContext: visitChoice_elements,
+        ASPCore2Parser.Choice_elementContext: visitChoice_element,
+        ASPCore2Parser.AggregateContext: visitAggregate,
+        ASPCore2Parser.Aggregate_elementsContext: visitAggregate_elements,
+        ASPCore2Parser.Aggregate_elementContext: visitAggregate_element,
+        ASPCore2Parser.Aggregate_functionContext: visitAggregate_function,
+        ASPCore2Parser.Weight_at_levelContext: visitWeight_at_level,
+        ASPCore2Parser.Naf_literalsContext: visitNaf_literals,
+        ASPCore2Parser.Naf_literalContext: visitNaf_literal,
+        ASPCore2Parser.Classical_literalContext: visitClassical_literal,
+        ASPCore2Parser.Builtin_atomContext: visitBuiltin_atom,
+        ASPCore2Parser.RelopContext: visitRelop,
+        ASPCore2Parser.TermsContext: visitTerms,
+        ASPCore2Parser.TermContext: visitTerm,
+        ASPCore2Parser.Term_sumContext: visitTerm_sum,
+        ASPCore2Parser.Term_prodContext: visitTerm_prod,
+        ASPCore2Parser.Term_atomContext: visitTerm_atom,
+        ASPCore2Parser.Symbolic_termContext: visitSymbolic_term,
+    }
@@ -13,6 +13,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class Query(Expr):
     """Query."""
 
+    __slots__ = ("atom",)
+
     def __init__(self: Self, atom: "PredLiteral") -> None:
         self.atom = atom
 
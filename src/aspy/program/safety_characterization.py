@@ -14,11 +14,17 @@ class SafetyRule:
     Attributes:
         depender: `Variable` instance representing the depender.
         dependees: Set of `Variable` instances representing the dependees.
+            Stored as a frozen set.
     """  # noqa
 
     depender: "Variable"
     dependees: Set["Variable"]
 
+    def __post_init__(self: Self) -> None:
+        # never modified (dependees can be shared and hash can be computed once)
+        self.dependees = frozenset(self.dependees)
+        self._hash = hash(("safety rule", self.depender, self.dependees))
+
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the safety rule to a given object.
 
@@ -31,8 +37,9 @@ class SafetyRule:
         Returns:
             Boolean indicating whether or not the safety rule is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, SafetyRule)
+            and self._hash == other._hash
             and self.depender == other.depender
             and self.dependees == other.dependees
         )
@@ -43,7 +50,7 @@ class SafetyRule:
         )
 
     def __hash__(self: Self) -> int:
-        return hash(("safety rule", self.depender, frozenset(self.dependees)))
+        return self._hash
 
 
 class SafetyTriplet:
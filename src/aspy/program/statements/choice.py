@@ -1,11 +1,11 @@
 import itertools
-from copy import deepcopy
 from functools import cached_property
 from itertools import chain, combinations
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -62,6 +62,8 @@ class ChoiceElement(Expr):
         ground: Boolean indicating whether or not the element is ground.
     """
 
+    __slots__ = ("atom", "literals", "__dict__")
+
     def __init__(
         self: Self,
         atom: "PredLiteral",
@@ -80,7 +82,7 @@ class ChoiceElement(Expr):
         self.literals = (
             literals
             if isinstance(literals, LiteralCollection)
-            else LiteralCollection(*literals)
+            else LiteralCollection.from_iterable(literals)
         )
 
     def __eq__(self: Self, other: "Any") -> bool:
@@ -101,6 +103,10 @@ class ChoiceElement(Expr):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("choice element", self.atom, self.literals))
 
     def __str__(self: Self) -> str:
@@ -112,9 +118,7 @@ class ChoiceElement(Expr):
             If the element has no literals, the colon is omitted.
         """  # noqa
         return str(self.atom) + (
-            f":{','.join([str(literal) for literal in self.literals])}"
-            if self.literals
-            else ""
+            f":{','.join(map(str, self.literals))}" if self.literals else ""
         )
 
     @property
@@ -151,6 +155,10 @@ class ChoiceElement(Expr):
         Returns:
             A (possibly empty) set of `Variable` instances.
         """
+        # ground elements do not contain any variables
+        if self.ground:
+            return set()
+
         return self.atom.vars().union(self.literals.vars())
 
     def global_vars(
@@ -259,6 +267,8 @@ class Choice(Expr):
             The expression is considered ground if all guards and elements are ground.
     """  # noqa
 
+    __slots__ = ("elements", "lguard", "rguard", "__dict__")
+
     def __init__(
         self: Self,
         elements: Tuple[ChoiceElement],
@@ -324,12 +334,20 @@ class Choice(Expr):
         """
         return (
             isinstance(other, Choice)
-            and set(self.elements) == set(other.elements)
+            and self._element_set == other._element_set
             and self.guards == other.guards
         )
 
     def __hash__(self: Self) -> int:
-        return hash(("choice", frozenset(self.elements), self.guards))
+        return self._hash
+
+    @cached_property
+    def _element_set(self: Self) -> FrozenSet[ChoiceElement]:
+        return frozenset(self.elements)
+
+    @cached_property
+    def _hash(self: Self) -> int:
+        return hash(("choice", self._element_set, self.guards))
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the choice expression.
@@ -339,7 +357,7 @@ class Choice(Expr):
             Contains the string representations of the elements, separated by semicolons,
             Guard representations precede or succeed the string if specified.
         """  # noqa
-        elements_str = ";".join([str(literal) for literal in self.elements])
+        elements_str = ";".join(map(str, self.elements))
         lguard_str = f"{str(self.lguard)} " if self.lguard is not None else ""
         rguard_str = f" {str(self.rguard)}" if self.rguard is not None else ""
 
@@ -365,7 +383,7 @@ class Choice(Expr):
     def ground(self: Self) -> bool:
         return all(element.ground for element in self.elements)
 
-    @property
+    @cached_property
     def guards(self: Self) -> Tuple[Union["Guard", None], Union["Guard", None]]:
         return (self.lguard, self.rguard)
 
@@ -375,7 +393,16 @@ class Choice(Expr):
         Returns:
             Set of `Variable` instances that occurr inside any of the elements.
         """
-        return set().union(*tuple(element.vars() for element in self.elements))
+        invars = set()
+
+        # ground choice expressions do not contain any variables
+        if self.ground:
+            return invars
+
+        for element in self.elements:
+            invars.update(element.vars())
+
+        return invars
 
     def outvars(self: Self) -> Set["Variable"]:
         """Outer variables.
@@ -383,9 +410,13 @@ class Choice(Expr):
         Returns:
             Set of `Variable` instances that occurr in any of the guards.
         """
-        return set().union(
-            *tuple(guard.bound.vars() for guard in self.guards if guard is not None)
-        )
+        outvars = set()
+
+        for guard in self.guards:
+            if guard is not None:
+                outvars.update(guard.bound.vars())
+
+        return outvars
 
     def vars(self: Self) -> Set["Variable"]:
         """Returns the variables associated with the choice expressions.
@@ -619,11 +650,13 @@ class Choice(Expr):
         Returns:
             `Choice` instance with (possibly substituted) guards and elements.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         # substitute elements recursively
-        elements = (element.substitute(subst) for element in self.elements)
+        elements = tuple(element.substitute(subst) for element in self.elements)
 
         # substitute guard terms recursively
         guards = tuple(
@@ -644,16 +677,15 @@ class Choice(Expr):
         Returns:
             `Choice` instance.
         """  # noqa
+        # replace elements first (determines numbering of arithmetic variables)
+        elements = tuple(element.replace_arith(var_table) for element in self.elements)
         # replace guards
-        guards = (
+        guards = tuple(
             None if guard is None else guard.replace_arith(var_table)
             for guard in self.guards
         )
 
-        return Choice(
-            tuple(element.replace_arith(var_table) for element in self.elements),
-            guards,
-        )
+        return Choice(elements, guards)
 
     def range(self: Self) -> Iterator[int]:
         """TODO"""
@@ -743,6 +775,8 @@ class ChoiceRule(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("choice", "literals", "__dict__")
+
     def __init__(
         self: Self,
         head: Choice,
@@ -767,7 +801,9 @@ class ChoiceRule(Statement):
 
         self.choice = head
         self.literals = (
-            body if isinstance(body, LiteralCollection) else LiteralCollection(*body)
+            body
+            if isinstance(body, LiteralCollection)
+            else LiteralCollection.from_iterable(body)
         )
 
     def __eq__(self: Self, other: "Any") -> bool:
@@ -789,6 +825,10 @@ class ChoiceRule(Statement):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("choice rule", self.head, self.literals))
 
     def __str__(self: Self) -> str:
@@ -857,8 +897,10 @@ class ChoiceRule(Statement):
         Returns:
             `ChoiceRule` instance with (possibly substituted) choice and literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         return ChoiceRule(self.head.substitute(subst), self.body.substitute(subst))
 
@@ -916,9 +958,7 @@ class ChoiceRule(Statement):
         aggr_literals = []
 
         for literal in self.body:
-            (
-                aggr_literals if isinstance(literal, AggrLiteral) else non_aggr_literals
-            ).append(literal)
+            (aggr_literals if literal.is_aggr else non_aggr_literals).append(literal)
 
         # mapping from original literals to alpha literals
         alpha_map = dict()
@@ -945,7 +985,7 @@ class ChoiceRule(Statement):
         alpha_rule = ChoiceRule(
             self.choice,
             tuple(
-                alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
+                alpha_map[literal] if literal.is_aggr else literal
                 for literal in self.body
             ),  # NOTE: restores original order of literals
         )
@@ -966,10 +1006,7 @@ class ChoiceRule(Statement):
         """
         return ChoiceRule(
             self.choice,
-            *tuple(
-                literal if literal not in assembling_map else assembling_map[literal]
-                for literal in self.body
-            ),
+            tuple(assembling_map.get(literal, literal) for literal in self.body),
         )
 
     def rewrite_choices(
@@ -1,6 +1,5 @@
-from copy import deepcopy
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Dict, Self, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Self, Set, Tuple
 
 from aspy.program.literals import AggrLiteral, LiteralCollection
 from aspy.program.safety_characterization import SafetyTriplet
@@ -39,6 +38,8 @@ class Constraint(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("literals", "__dict__")
+
     deterministic: bool = True
 
     def __init__(self: Self, *literals: "Literal", **kwargs) -> None:
@@ -49,7 +50,7 @@ class Constraint(Statement):
         """
         super().__init__(**kwargs)
 
-        self.literals = LiteralCollection(*literals)
+        self.literals = LiteralCollection.from_iterable(literals)
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the statement to a given object.
@@ -62,12 +63,18 @@ class Constraint(Statement):
         Returns:
             Boolean indicating whether or not the statement is considered equal to the given object.
         """  # noqa
-        return isinstance(other, Constraint) and set(self.literals) == set(
-            other.literals
-        )
+        return isinstance(other, Constraint) and self._literal_set == other._literal_set
 
     def __hash__(self: Self) -> int:
-        return hash(("constraint", frozenset(self.literals)))
+        return self._hash
+
+    @cached_property
+    def _literal_set(self: Self) -> FrozenSet["Literal"]:
+        return frozenset(self.literals)
+
+    @cached_property
+    def _hash(self: Self) -> int:
+        return hash(("constraint", self._literal_set))
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -75,7 +82,7 @@ class Constraint(Statement):
         Returns:
             String representing the statement.
         """
-        return f":- {', '.join([str(literal) for literal in self.body])}."
+        return f":- {', '.join(map(str, self.body))}."
 
     @property
     def head(self: Self) -> LiteralCollection:
@@ -94,11 +101,12 @@ class Constraint(Statement):
 
     @cached_property
     def ground(self: Self) -> bool:
-        return all(literal.ground for literal in self.literals)
+        # cached by literal collection (shared by statements with the same literals)
+        return self.literals.ground
 
     @cached_property
     def contains_aggregates(self: Self) -> bool:
-        return any(isinstance(literal, AggrLiteral) for literal in self.literals)
+        return any(literal.is_aggr for literal in self.literals)
 
     def substitute(self: Self, subst: "Substitution") -> "Constraint":
         """Applies a substitution to the statement.
@@ -111,10 +119,17 @@ class Constraint(Statement):
         Returns:
             `Constraint` instance with (possibly substituted) literals.
         """
+        # ground statements are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
+
+        literals = self.literals.substitute(subst)
 
-        return Constraint(*self.literals.substitute(subst))
+        # substitution does not affect any variables of the statement
+        if literals is self.literals:
+            return self
+
+        return Constraint(*literals)
 
     def rewrite_aggregates(
         self: Self,
@@ -148,14 +163,16 @@ class Constraint(Statement):
         # global variables
         glob_vars = self.global_vars(self)
 
-        # group literals
-        non_aggr_literals = []
-        aggr_literals = []
+        body = self.body
 
-        for literal in self.body:
-            (
-                aggr_literals if isinstance(literal, AggrLiteral) else non_aggr_literals
-            ).append(literal)
+        # group literals (mask is reused when replacing the aggregates below)
+        aggr_mask = [literal.is_aggr for literal in body]
+        aggr_literals = [
+            literal for literal, is_aggr in zip(body, aggr_mask) if is_aggr
+        ]
+        non_aggr_literals = [
+            literal for literal, is_aggr in zip(body, aggr_mask) if not is_aggr
+        ]
 
         # mapping from original literals to alpha literals
         alpha_map = dict()
@@ -181,8 +198,8 @@ class Constraint(Statement):
         # replace original rule with modified one
         alpha_rule = Constraint(
             *tuple(
-                alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
-                for literal in self.body
+                alpha_map[literal] if is_aggr else literal
+                for literal, is_aggr in zip(body, aggr_mask)
             ),  # NOTE: restores original order of literals
         )
 
@@ -201,10 +218,7 @@ class Constraint(Statement):
             `Constraint` instance representing the reassembled original statement.
         """
         return Constraint(
-            *tuple(
-                literal if literal not in assembling_map else assembling_map[literal]
-                for literal in self.body
-            ),
+            *tuple(assembling_map.get(literal, literal) for literal in self.body),
         )
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "TermTuple":
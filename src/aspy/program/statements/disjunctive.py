@@ -62,6 +62,8 @@ class DisjunctiveRule(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("atoms", "literals", "__dict__")
+
     deterministic: bool = False
 
     def __init__(
@@ -101,10 +103,14 @@ class DisjunctiveRule(Statement):
             )
 
         self.atoms = (
-            head if isinstance(head, LiteralCollection) else LiteralCollection(*head)
+            head
+            if isinstance(head, LiteralCollection)
+            else LiteralCollection.from_iterable(head)
         )
         self.literals = (
-            body if isinstance(body, LiteralCollection) else LiteralCollection(*body)
+            body
+            if isinstance(body, LiteralCollection)
+            else LiteralCollection.from_iterable(body)
         )
 
     def __eq__(self: Self, other: "Any") -> bool:
@@ -126,6 +132,10 @@ class DisjunctiveRule(Statement):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("disjunctive rule", self.atoms, self.literals))
 
     def __str__(self: Self) -> str:
@@ -134,7 +144,12 @@ class DisjunctiveRule(Statement):
         Returns:
             String representing the statement.
         """
-        return f"{' | '.join([str(atom) for atom in self.head])}{f' :- {str(self.body)}' if self.body else ''}."  # noqa
+        return self._str
+
+    @cached_property
+    def _str(self: Self) -> str:
+        # statements are never modified (string can be computed once)
+        return f"{' | '.join(map(str, self.head))}{f' :- {str(self.body)}' if self.body else ''}."  # noqa
 
     @property
     def head(self: Self) -> LiteralCollection:
@@ -167,8 +182,10 @@ class DisjunctiveRule(Statement):
             atoms and literals. `NormalRule` is returned if the substitution results
             in a single unique head atom.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         subst_head = self.head.substitute(subst)
 
@@ -215,9 +232,7 @@ class DisjunctiveRule(Statement):
         aggr_literals = []
 
         for literal in self.body:
-            (
-                aggr_literals if isinstance(literal, AggrLiteral) else non_aggr_literals
-            ).append(literal)
+            (aggr_literals if literal.is_aggr else non_aggr_literals).append(literal)
 
         # mapping from original literals to alpha literals
         alpha_map = dict()
@@ -244,7 +259,7 @@ class DisjunctiveRule(Statement):
         alpha_rule = DisjunctiveRule(
             deepcopy(self.atoms),
             tuple(
-                alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
+                alpha_map[literal] if literal.is_aggr else literal
                 for literal in self.body
             ),  # NOTE: restores original order of literals
         )
@@ -265,10 +280,7 @@ class DisjunctiveRule(Statement):
         """
         return DisjunctiveRule(
             deepcopy(self.atoms),
-            tuple(
-                literal if literal not in assembling_map else assembling_map[literal]
-                for literal in self.body
-            ),
+            tuple(assembling_map.get(literal, literal) for literal in self.body),
         )
 
     def replace_arith(self: Self) -> "DisjunctiveRule":
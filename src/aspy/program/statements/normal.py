@@ -50,6 +50,8 @@ class NormalRule(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("atom", "literals", "__dict__")
+
     deterministic: bool = True
 
     def __init__(
@@ -72,7 +74,7 @@ class NormalRule(Statement):
 
         self.atom = atom
         self.literals = (
-            LiteralCollection(*body)
+            LiteralCollection.from_iterable(body)
             if not isinstance(body, LiteralCollection)
             else body
         )
@@ -96,6 +98,10 @@ class NormalRule(Statement):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("normal rule", self.atom, self.literals))
 
     def __str__(self: Self) -> str:
@@ -104,6 +110,11 @@ class NormalRule(Statement):
         Returns:
             String representing the statement.
         """
+        return self._str
+
+    @cached_property
+    def _str(self: Self) -> str:
+        # statements are never modified (string can be computed once)
         return f"{str(self.atom)}{f' :- {str(self.body)}' if self.body else ''}."
 
     @property
@@ -133,10 +144,19 @@ class NormalRule(Statement):
         Returns:
             `NormalRule` instance with (possibly substituted) atom and literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
-        return NormalRule(self.atom.substitute(subst), self.literals.substitute(subst))
+        atom = self.atom.substitute(subst)
+        literals = self.literals.substitute(subst)
+
+        # substitution does not affect any variables of the statement
+        if atom is self.atom and literals is self.literals:
+            return self
+
+        return NormalRule(atom, literals)
 
     def replace_arith(self: Self) -> "NormalRule":
         """Replaces arithmetic terms appearing in the statement with arithmetic variables.
@@ -192,9 +212,7 @@ class NormalRule(Statement):
         aggr_literals = []
 
         for literal in self.body:
-            (
-                aggr_literals if isinstance(literal, AggrLiteral) else non_aggr_literals
-            ).append(literal)
+            (aggr_literals if literal.is_aggr else non_aggr_literals).append(literal)
 
         # mapping from original literals to alpha literals
         alpha_map = dict()
@@ -221,7 +239,7 @@ class NormalRule(Statement):
         alpha_rule = NormalRule(
             self.atom,
             tuple(
-                alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
+                alpha_map[literal] if literal.is_aggr else literal
                 for literal in self.body
             ),  # NOTE: restores original order of literals
         )
@@ -242,10 +260,7 @@ class NormalRule(Statement):
         """
         return NormalRule(
             self.atom,
-            tuple(
-                literal if literal not in assembling_map else assembling_map[literal]
-                for literal in self.body
-            ),
+            tuple(assembling_map.get(literal, literal) for literal in self.body),
         )
 
     def assemble_choices(
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Self, Type, Union
 
 import aspy
@@ -27,6 +27,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class PropBaseRule(NormalRule):
     """TODO."""
 
+    __slots__ = ("guards",)
+
     def __init__(
         self: Self,
         atom: PropBaseLiteral,
@@ -70,7 +72,8 @@ class PropBaseRule(NormalRule):
                 )
 
         # create head atom/literal
-        atom = atom_type(ref_id, glob_vars, deepcopy(glob_vars))
+        # (terms are never modified, so the global variables can be shared)
+        atom = atom_type(ref_id, glob_vars, glob_vars)
         # compute guard literals and combine them with non-aggregate literals
         lguard_literal = (
             op2rel[lguard.op](lguard.bound, base_value) if lguard is not None else None
@@ -78,19 +81,19 @@ class PropBaseRule(NormalRule):
         rguard_literal = (
             op2rel[rguard.op](base_value, rguard.bound) if rguard is not None else None
         )
-        guard_literals = LiteralCollection(
-            *tuple(
-                guard_literal
-                for guard_literal in (lguard_literal, rguard_literal)
-                if guard_literal is not None
-            )
+        guard_literals = LiteralCollection.from_iterable(
+            guard_literal
+            for guard_literal in (lguard_literal, rguard_literal)
+            if guard_literal is not None
         )
 
         return cls(atom, lguard, rguard, guard_literals + literals)
 
     def substitute(self: Self, subst: "Substitution") -> "PropBaseRule":
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -122,6 +125,8 @@ class PropBaseRule(NormalRule):
 class PropElemRule(NormalRule):
     """TODO."""
 
+    __slots__ = ("element",)
+
     def __init__(
         self: Self,
         atom: PropElemLiteral,
@@ -140,6 +145,10 @@ class PropElemRule(NormalRule):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(
             ("prop element rule", type(self), self.atom, self.literals, self.element)
         )
@@ -170,9 +179,10 @@ class PropElemRule(NormalRule):
         literals: "LiteralCollection",
         atom_type: Type = PropElemLiteral,
     ) -> "PropElemRule":
-        # compute local variables
-        local_vars = TermTuple(
-            *tuple(var for var in element.vars() if var not in glob_vars)
+        # compute local variables (set for constant-time membership tests)
+        glob_var_set = frozenset(glob_vars)
+        local_vars = TermTuple.from_tuple(
+            tuple(var for var in element.vars() if var not in glob_var_set)
         )
 
         # create head atom/literal
@@ -185,8 +195,10 @@ class PropElemRule(NormalRule):
         return cls(atom, element, literals)
 
     def substitute(self: Self, subst: "Substitution") -> "PropElemRule":
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -208,6 +220,8 @@ class PropElemRule(NormalRule):
 class AggrBaseRule(PropBaseRule):
     """TODO."""
 
+    __slots__ = ()
+
     def __init__(
         self: Self,
         atom: AggrBaseLiteral,
@@ -241,6 +255,8 @@ class AggrBaseRule(PropBaseRule):
 class AggrElemRule(PropElemRule):
     """TODO."""
 
+    __slots__ = ()
+
     def __init__(
         self: Self,
         atom: AggrElemLiteral,
@@ -271,6 +287,8 @@ class AggrElemRule(PropElemRule):
 class ChoiceBaseRule(PropBaseRule):
     """TODO."""
 
+    __slots__ = ()
+
     def __init__(
         self: Self,
         atom: ChoiceBaseLiteral,
@@ -303,6 +321,8 @@ class ChoiceBaseRule(PropBaseRule):
 class ChoiceElemRule(PropElemRule):
     """TODO."""
 
+    __slots__ = ()
+
     def __init__(
         self: Self,
         atom: ChoiceElemLiteral,
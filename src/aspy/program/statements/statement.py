@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Dict, Optional, Self, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Self, Set, Tuple
 
 from aspy.program.expression import Expr
 from aspy.program.literals import AggrLiteral
@@ -38,7 +38,7 @@ class Statement(Expr, ABC):
             aggregate expressions.
     """
 
-    __slots__ = "deterministic"
+    __slots__ = ("deterministic", "__var_table")
 
     def __init__(
         self: Self, var_table: Optional["VariableTable"] = None, *args, **kwargs
@@ -86,7 +86,7 @@ class Statement(Expr, ABC):
 
     @cached_property
     def contains_aggregates(self: Self) -> bool:
-        return any(isinstance(literal, AggrLiteral) for literal in self.body)
+        return any(literal.is_aggr for literal in self.body)
 
     @property
     def var_table(self: Self) -> "VariableTable":
@@ -118,7 +118,12 @@ class Statement(Expr, ABC):
         Returns:
             Set of `Variable` instances.
         """
-        return self.var_table.global_vars()
+        return set(self._global_vars)
+
+    @cached_property
+    def _global_vars(self: Self) -> FrozenSet["Variable"]:
+        # computed once (e.g., reused by aggregates during safety characterization)
+        return frozenset(self.var_table.global_vars())
 
     def safety(self: Self, statment: Optional["Statement"] = None) -> "SafetyTriplet":
         """Returns the safety characterization for the statement.
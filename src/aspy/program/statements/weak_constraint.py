@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import cached_property
 from typing import TYPE_CHECKING, Dict, Iterable, Optional, Self, Set, Tuple
 
@@ -33,6 +32,8 @@ class WeightAtLevel(Expr):
         ground: Boolean indicating whether or not the term is ground.
     """
 
+    __slots__ = ("weight", "level", "terms", "__dict__")
+
     def __init__(
         self: Self,
         weight: "Term",
@@ -51,8 +52,15 @@ class WeightAtLevel(Expr):
 
         Returns:
             String representing the weight at level.
+            If there are no terms, the trailing comma is omitted.
         """
-        return f"{str(self.weight)}@{str(self.level)}, {str(self.terms)}"
+        return self._str
+
+    @cached_property
+    def _str(self: Self) -> str:
+        # weights at levels are never modified (string can be computed once)
+        terms_str = f", {str(self.terms)}" if self.terms else ""
+        return f"{str(self.weight)}@{str(self.level)}{terms_str}"
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the weight at level to a given object.
@@ -74,6 +82,10 @@ class WeightAtLevel(Expr):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("weight at level", self.weight, self.level, self.terms))
 
     @cached_property
@@ -141,8 +153,9 @@ class WeightAtLevel(Expr):
         Returns:
             `WeightAtLevel` instance with (possibly substituted) terms.
         """
+        # ground weights at levels are not affected by substitutions (never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         return WeightAtLevel(
             self.weight.substitute(subst),
@@ -194,6 +207,8 @@ class WeakConstraint(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("literals", "weight_at_level", "__dict__")
+
     deterministic: bool = True
 
     def __init__(
@@ -210,7 +225,7 @@ class WeakConstraint(Statement):
         super().__init__()
 
         self.literals = (
-            LiteralCollection(*literals)
+            LiteralCollection.from_iterable(literals)
             if not isinstance(literals, LiteralCollection)
             else literals
         )
@@ -235,6 +250,10 @@ class WeakConstraint(Statement):
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("weak constraint", self.literals, self.weight_at_level))
 
     def __str__(self: Self) -> str:
@@ -243,6 +262,11 @@ class WeakConstraint(Statement):
         Returns:
             String representing the statement.
         """
+        return self._str
+
+    @cached_property
+    def _str(self: Self) -> str:
+        # statements are never modified (string can be computed once)
         return f":~ {str(self.body)}. [{str(self.weight_at_level)}]"
 
     def __init_var_table(self: Self) -> None:
@@ -275,13 +299,12 @@ class WeakConstraint(Statement):
 
     @cached_property
     def ground(self: Self) -> bool:
-        return self.weight_at_level.ground and all(
-            literal.ground for literal in self.literals
-        )
+        # cached by literal collection (shared by statements with the same literals)
+        return self.weight_at_level.ground and self.literals.ground
 
     @cached_property
     def contains_aggregates(self: Self) -> bool:
-        return any(isinstance(literal, AggrLiteral) for literal in self.literals)
+        return any(literal.is_aggr for literal in self.literals)
 
     def substitute(self: Self, subst: "Substitution") -> "WeakConstraint":
         """Applies a substitution to the statement.
@@ -295,8 +318,10 @@ class WeakConstraint(Statement):
             `WeakConstraint` instance with (possibly substituted) literals and
             weight at level.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground statements are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         return WeakConstraint(
             self.literals.substitute(subst),
@@ -341,9 +366,7 @@ class WeakConstraint(Statement):
         aggr_literals = []
 
         for literal in self.body:
-            (
-                aggr_literals if isinstance(literal, AggrLiteral) else non_aggr_literals
-            ).append(literal)
+            (aggr_literals if literal.is_aggr else non_aggr_literals).append(literal)
 
         # mapping from original literals to alpha literals
         alpha_map = dict()
@@ -369,7 +392,7 @@ class WeakConstraint(Statement):
         # replace original rule with modified one
         alpha_rule = WeakConstraint(
             tuple(
-                alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
+                alpha_map[literal] if literal.is_aggr else literal
                 for literal in self.body
             ),  # NOTE: restores original order of literals
             self.weight_at_level,
@@ -390,10 +413,7 @@ class WeakConstraint(Statement):
             `WeakConstraint` instance representing the reassembled original statement.
         """
         return WeakConstraint(
-            tuple(
-                literal if literal not in assembling_map else assembling_map[literal]
-                for literal in self.body
-            ),
+            tuple(assembling_map.get(literal, literal) for literal in self.body),
             self.weight_at_level,
         )
 
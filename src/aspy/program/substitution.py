@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Dict, Optional, Self, Type
 
@@ -26,6 +25,8 @@ class AssignmentError(Exception):
 class Substitution(dict):
     """Substitution mapping variables to terms replacing those variables."""
 
+    __slots__ = ()
+
     def __init__(
         self: Self, subst_dict: Optional[Dict["Variable", "Term"]] = None
     ) -> None:
@@ -46,10 +47,10 @@ class Substitution(dict):
 
         Returns:
             `Term` instance representing the target of the substitution.
-            Note: a copy is returned instead of the original object.
+            Note: terms are never modified, so the original object is returned.
         """
         # map variables to themselves if no substitution specified
-        return deepcopy(dict.__getitem__(self, var)) if var in self else deepcopy(var)
+        return dict.get(self, var, var)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the substitution.
@@ -98,7 +99,8 @@ class Substitution(dict):
         Raises:
             AssignmentError: Assignment conflict between both substitutions.
         """
-        subst = dict(self.items())
+        # copy once (combined substitution is updated in-place below)
+        subst = Substitution(self)
 
         for var, target in other.items():
             if var in subst:
@@ -107,7 +109,7 @@ class Substitution(dict):
             else:
                 subst[var] = target
 
-        return Substitution(subst)
+        return subst
 
     def compose(self: Self, other: "Substitution") -> "Substitution":
         """Composes substitution with another one.
@@ -122,14 +124,16 @@ class Substitution(dict):
         """
 
         # apply other substitution to substituted values
-        subst = {var: target.substitute(other) for (var, target) in self.items()}
+        subst = Substitution(
+            {var: target.substitute(other) for (var, target) in self.items()}
+        )
         # add substitution of variables that are not in the original substitution
         # (i.e., originally mapped onto themselves)
-        subst.update(
-            {var: target for (var, target) in other.items() if var not in subst}
-        )
+        for var, target in other.items():
+            if var not in subst:
+                subst[var] = target
 
-        return Substitution(subst)
+        return subst
 
     @classmethod
     def composition(
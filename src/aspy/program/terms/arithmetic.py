@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Self, Set, Tuple, Union
 
@@ -26,8 +25,11 @@ class ArithTerm(Term, ABC):
     Attributes:
         ground: Boolean indicating whether or not all operands are ground.
         operands: Tuple consisting of the left and right operands.
+        is_arith: Boolean indicating whether or not the term is an arithmetic term.
     """  # noqa
 
+    is_arith = True
+
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
 
@@ -80,7 +82,7 @@ class ArithTerm(Term, ABC):
         Returns:
             (Possibly empty) set of `Variable` instances as union of the variables of all operands.
         """  # noqa
-        return set().union(*tuple(operand.vars() for operand in self.operands))
+        return set().union(*[operand.vars() for operand in self.operands])
 
     def safety(
         self: Self, statement: Optional[Union["Statement", "Query"]] = None
@@ -97,7 +99,7 @@ class ArithTerm(Term, ABC):
             `SafetyTriplet` instance with all variables marked as unsafe.
         """  # noqa
         return SafetyTriplet(
-            unsafe=set().union(*tuple(operand.vars() for operand in self.operands))
+            unsafe=set().union(*[operand.vars() for operand in self.operands])
         )
 
     def replace_arith(
@@ -157,8 +159,9 @@ class ArithTerm(Term, ABC):
         Returns:
             `TermTuple` instance with (possibly substituted) terms.
         """
+        # ground terms are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         # substitute operands recursively
         operands = (operand.substitute(subst) for operand in self.operands)
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Self, Set, Union
 
@@ -7,7 +6,7 @@ from aspy.program.safety_characterization import SafetyTriplet
 from aspy.program.substitution import Substitution
 from aspy.program.symbols import SYM_CONST_RE
 
-from .term import Infimum, Number, String, SymbolicConstant, Term, TermTuple
+from .term import Term, TermTuple
 
 if TYPE_CHECKING:  # pragma: no cover
     from aspy.program.expression import Expr
@@ -45,7 +44,7 @@ class Functional(Term):
             raise ValueError(f"Invalid value for {type(self)}: {symbol}")
 
         self.symbol = symbol
-        self.terms = TermTuple(*terms)
+        self.terms = TermTuple.from_tuple(terms)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a functional term.
@@ -56,7 +55,7 @@ class Functional(Term):
             seperated by commas and enclosed by parentheses.
             If the functional term has no terms, the parentheses are omitted.
         """  # noqa
-        return self.symbol + (f"({','.join([str(term) for term in self.terms])})")
+        return f"{self.symbol}({str(self.terms)})"
 
     def __eq__(self: Self, other: "Any") -> str:
         """Compares the term to a given object.
@@ -88,7 +87,8 @@ class Functional(Term):
         return self.terms.ground
 
     def precedes(self: Self, other: Term) -> bool:
-        if isinstance(other, (Infimum, Number, SymbolicConstant, String)):
+        # preceded by any term type of lower rank
+        if other.rank < self.rank:
             return False
         elif isinstance(other, Functional):
             if self.arity == other.arity:
@@ -173,8 +173,9 @@ class Functional(Term):
         Returns:
             `Functional` instance with (possibly substituted) terms.
         """
+        # ground terms are not affected by substitutions (and never modified)
         if self.ground:
-            return deepcopy(self)
+            return self
 
         # substitute terms recursively
         terms = (term.substitute(subst) for term in self.terms)
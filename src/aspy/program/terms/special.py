@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Self, Tuple, Type
 
 import aspy
 from aspy.program.symbols import SpecialChar
@@ -69,6 +69,12 @@ class ArithVariable(Variable):
     def __hash__(self: Self) -> int:
         return hash(("arith var", self.val, self.orig_term))
 
+    def __reduce__(
+        self: Self,
+    ) -> Tuple[Type["ArithVariable"], Tuple[int, "ArithTerm"]]:
+        # re-create instance from its id and the original arithmetic term
+        return (type(self), (self.id, self.orig_term))
+
     def precedes(self: Self, other: "Term") -> bool:
         """Checks precendence w.r.t. a given term.
 
@@ -1,7 +1,17 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Self, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import aspy
 from aspy.program.expression import Expr
@@ -15,13 +25,28 @@ if TYPE_CHECKING:  # pragma: no cover
     from aspy.program.variable_table import VariableTable
 
 
+# safety characterization shared by all terms without variables (never modified)
+EMPTY_SAFETY = SafetyTriplet()
+
+
 class Term(Expr, ABC):
     """Abstract base class for all terms.
 
     Declares some default as well as abstract methods for terms.
     All terms should inherit from this class or a subclass thereof.
+
+    Attributes:
+        is_arith: Boolean indicating whether or not the term is an arithmetic term.
+        rank: Integer representing the position of the term type in the total ordering
+            for terms (infimum, numbers, symbolic constants, strings, functional terms,
+            supremum). Defaults to the rank of functional terms.
     """
 
+    __slots__ = ()
+
+    is_arith = False
+    rank = 4
+
     @abstractmethod  # pragma: no cover
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -34,6 +59,14 @@ class Term(Expr, ABC):
         """  # noqa
         pass
 
+    def __copy__(self: Self) -> Self:
+        # terms are never modified (no need to copy)
+        return self
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        # terms are never modified (no need to copy)
+        return self
+
     @abstractmethod  # pragma: no cover
     def precedes(self: Self, other: "Term") -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -84,7 +117,7 @@ class Term(Expr, ABC):
         Returns:
             Empty `SafetyTriplet` instance.
         """  # noqa
-        return SafetyTriplet()
+        return EMPTY_SAFETY
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "Term":
         """Replaces arithmetic terms appearing in the term with arithmetic variables.
@@ -97,7 +130,8 @@ class Term(Expr, ABC):
         Returns:
             `Term` instance.
         """
-        return deepcopy(self)
+        # terms are never modified (no need to copy)
+        return self
 
     def substitute(self: Self, subst: Substitution) -> "Term":
         """Applies a substitution to the term.
@@ -110,7 +144,8 @@ class Term(Expr, ABC):
         Returns:
             (Possibly substituted) `Term` instance.
         """
-        return deepcopy(self)
+        # terms are never modified (no need to copy)
+        return self
 
     def match(self: Self, other: "Expr") -> Optional[Substitution]:
         """Tries to match the expression with another one.
@@ -133,7 +168,26 @@ class Infimum(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ()
+
+    __instance = None
+
     ground: bool = True
+    rank = 0
+    _hash = hash(("inf",))
+
+    def __new__(cls: Type["Infimum"]) -> "Infimum":
+        """Returns the shared infimum instance.
+
+        `Infimum` has no state, so a single instance is created and reused.
+
+        Returns:
+            `Infimum` instance.
+        """
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+
+        return cls.__instance
 
     def __str__(self: Self) -> str:
         """Returns the string representation for an infimum.
@@ -154,10 +208,15 @@ class Infimum(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, Infimum)
+        # single shared instance (equality reduces to identity)
+        return other is self
 
     def __hash__(self: Self) -> int:
-        return hash(("inf",))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["Infimum"], Tuple[()]]:
+        # unpickling returns the shared instance
+        return (type(self), ())
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -181,7 +240,26 @@ class Supremum(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ()
+
+    __instance = None
+
     ground: bool = True
+    rank = 5
+    _hash = hash(("sup",))
+
+    def __new__(cls: Type["Supremum"]) -> "Supremum":
+        """Returns the shared supremum instance.
+
+        `Supremum` has no state, so a single instance is created and reused.
+
+        Returns:
+            `Supremum` instance.
+        """
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+
+        return cls.__instance
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a supremum.
@@ -202,10 +280,15 @@ class Supremum(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, Supremum)
+        # single shared instance (equality reduces to identity)
+        return other is self
 
     def __hash__(self: Self) -> int:
-        return hash(("sup",))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["Supremum"], Tuple[()]]:
+        # unpickling returns the shared instance
+        return (type(self), ())
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -230,6 +313,8 @@ class Variable(Term):
         ground: Boolean indicating whether or not the term is ground (always `False`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = False
 
     def __init__(self: Self, val: str) -> None:
@@ -247,6 +332,8 @@ class Variable(Term):
             raise ValueError(f"Invalid value for {type(self)}: {val}")
 
         self.val = val
+        # terms are never modified (hash can be computed once)
+        self._hash = hash(("var", val))
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a variable.
@@ -270,7 +357,11 @@ class Variable(Term):
         return isinstance(other, Variable) and other.val == self.val
 
     def __hash__(self: Self) -> int:
-        return hash(("var", self.val))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["Variable"], Tuple[str]]:
+        # re-create instance from its value (hash is re-computed on unpickling)
+        return (type(self), (self.val,))
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence w.r.t. a given term.
@@ -330,7 +421,11 @@ class Variable(Term):
         Returns:
             A substitution necessary for matching (may be empty).
         """  # noqa
-        return Substitution({self: other}) if not self == other else Substitution()
+        # trivial match (identity is checked first to avoid comparing the terms)
+        if other is self or self == other:
+            return Substitution()
+
+        return Substitution({self: other})
 
     def substitute(self: Self, subst: Substitution) -> Term:
         """Applies a substitution to the term.
@@ -343,7 +438,8 @@ class Variable(Term):
         Returns:
             (Possibly substituted) `Term` instance.
         """
-        return subst[self]
+        # terms are never modified (no need to copy the target term)
+        return subst.get(self, self)
 
 
 class AnonVariable(Variable):
@@ -355,6 +451,8 @@ class AnonVariable(Variable):
         ground: Boolean indicating whether or not the term is ground (always `False`).
     """
 
+    __slots__ = ("id",)
+
     def __init__(self: Self, id: int) -> None:
         """Initializes the anonymous variable instance.
 
@@ -373,6 +471,8 @@ class AnonVariable(Variable):
 
         self.val = f"_{id}"
         self.id = id
+        # terms are never modified (hash can be computed once)
+        self._hash = hash(("anon var", self.val))
 
     def __eq__(self: Self, other: "Any") -> str:
         """Compares the term to a given object.
@@ -392,7 +492,11 @@ class AnonVariable(Variable):
         )
 
     def __hash__(self: Self) -> int:
-        return hash(("anon var", self.val))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["AnonVariable"], Tuple[int]]:
+        # re-create instance from its value (hash is re-computed on unpickling)
+        return (type(self), (self.id,))
 
     def simplify(self: Self) -> "AnonVariable":
         """Simplifies the variable as part of an arithmetic term.
@@ -413,7 +517,10 @@ class Number(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
+    rank = 1
 
     def __init__(self: Self, val: int) -> None:
         """Initializes the number instance.
@@ -422,6 +529,8 @@ class Number(Term):
             val: Integer representing the value of the number.
         """
         self.val = val
+        # terms are never modified (hash can be computed once)
+        self._hash = hash(("num", val))
 
     def __add__(self: Self, other: "Number") -> "Number":
         """Returns a number representing the sum of this and a given number.
@@ -502,10 +611,14 @@ class Number(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, Number) and other.val == self.val
+        return type(other) is Number and other.val == self.val
 
     def __hash__(self: Self) -> int:
-        return hash(("num", self.val))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["Number"], Tuple[int]]:
+        # re-create instance from its value (hash is re-computed on unpickling)
+        return (type(self), (self.val,))
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -530,22 +643,21 @@ class Number(Term):
                 )
             )
 
-        if isinstance(other, Infimum):
-            return False
-        elif isinstance(other, Number):
+        # compare values of numbers, otherwise ranks of the term types
+        if other.rank == self.rank:
             return self.val <= other.val
-        else:
-            return True
+
+        return self.rank < other.rank
 
     def simplify(self: Self) -> "Number":
         """Simplifies the variable as part of an arithmetic term.
 
-        Used in arithmetic terms. Returns a copy of itself, as numbers cannot be further simplified.
+        Used in arithmetic terms. Returns itself, as numbers cannot be further simplified.
 
         Returns:
-            Copy of the `Number` instance.
+            The `Number` instance itself.
         """  # noqa
-        return Number(self.val)
+        return self
 
     def eval(self: Self) -> int:
         """Evaluates the number.
@@ -564,7 +676,10 @@ class SymbolicConstant(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
+    rank = 2
 
     def __init__(self: Self, val: str) -> None:
         """Initializes the symbolic constant instance.
@@ -583,6 +698,8 @@ class SymbolicConstant(Term):
             raise ValueError(f"Invalid value for {type(self)}: {val}")
 
         self.val = val
+        # terms are never modified (hash can be computed once)
+        self._hash = hash(("symbolic const", val))
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a symbolic constant.
@@ -603,10 +720,14 @@ class SymbolicConstant(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, SymbolicConstant) and other.val == self.val
+        return type(other) is SymbolicConstant and other.val == self.val
 
     def __hash__(self: Self) -> int:
-        return hash(("symbolic const", self.val))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["SymbolicConstant"], Tuple[str]]:
+        # re-create instance from its value (hash is re-computed on unpickling)
+        return (type(self), (self.val,))
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -632,12 +753,11 @@ class SymbolicConstant(Term):
                 )
             )
 
-        if isinstance(other, (Infimum, Number)):
-            return False
-        elif isinstance(other, SymbolicConstant):
+        # compare values of symbolic constants, otherwise ranks of the term types
+        if other.rank == self.rank:
             return self.val <= other.val
-        else:
-            return True
+
+        return self.rank < other.rank
 
 
 class String(Term):
@@ -648,7 +768,10 @@ class String(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
+    rank = 3
 
     def __init__(self: Self, val: str) -> None:
         """Initializes the string instance.
@@ -657,6 +780,8 @@ class String(Term):
             val: String representing the string value.
         """
         self.val = val
+        # terms are never modified (hash can be computed once)
+        self._hash = hash(("str", val))
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a string.
@@ -677,10 +802,14 @@ class String(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, String) and other.val == self.val
+        return type(other) is String and other.val == self.val
 
     def __hash__(self: Self) -> int:
-        return hash(("str", self.val))
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Type["String"], Tuple[str]]:
+        # re-create instance from its value (hash is re-computed on unpickling)
+        return (type(self), (self.val,))
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -705,12 +834,11 @@ class String(Term):
                 )
             )
 
-        if isinstance(other, (Infimum, Number, SymbolicConstant)):
-            return False
-        elif isinstance(other, String):
+        # compare values of strings, otherwise ranks of the term types
+        if other.rank == self.rank:
             return self.val <= other.val
-        else:
-            return True
+
+        return self.rank < other.rank
 
 
 class TermTuple:
@@ -721,6 +849,28 @@ class TermTuple:
         ground: Boolean indicating whether or not all terms are ground.
     """
 
+    __empty = None
+
+    def __new__(cls: Type["TermTuple"], *terms: Term) -> "TermTuple":
+        """Returns a new term tuple or the shared empty one.
+
+        Term tuples are never modified, so a single empty instance is created
+        and reused.
+
+        Args:
+            *terms: sequence of terms.
+
+        Returns:
+            `TermTuple` instance.
+        """
+        if terms:
+            return super().__new__(cls)
+
+        if cls.__empty is None:
+            cls.__empty = super().__new__(cls)
+
+        return cls.__empty
+
     def __init__(self: Self, *terms: Term) -> None:
         """Initializes the term tuple instance.
 
@@ -728,6 +878,35 @@ class TermTuple:
             *terms: sequence of terms.
         """
         self.terms = terms
+        # terms are never modified (groundness can be determined once)
+        self.ground = all(term.ground for term in terms)
+
+    @classmethod
+    def from_tuple(cls: Type["TermTuple"], terms: Tuple[Term, ...]) -> "TermTuple":
+        """Creates a term tuple from an existing tuple of terms.
+
+        Stores the given tuple directly, avoiding the copy caused by unpacking
+        the terms as positional arguments.
+
+        Args:
+            terms: Tuple of `Term` instances.
+
+        Returns:
+            `TermTuple` instance.
+        """
+        # empty term tuples are shared
+        if not terms:
+            return cls()
+
+        term_tuple = object.__new__(cls)
+        term_tuple.terms = terms
+        term_tuple.ground = all(term.ground for term in terms)
+
+        return term_tuple
+
+    def __getnewargs__(self: Self) -> Tuple[Term, ...]:
+        # passed to '__new__' on unpickling (empty term tuples stay shared)
+        return self.terms
 
     def __len__(self: Self) -> int:
         return len(self.terms)
@@ -744,18 +923,25 @@ class TermTuple:
         Returns:
             Boolean indicating whether or not the term tuple is considered equal to the given object.
         """  # noqa
-        return (
-            isinstance(other, TermTuple)
-            and len(self) == len(other)
-            and all(t1 == t2 for t1, t2 in zip(self, other))
+        return self is other or (
+            isinstance(other, TermTuple) and self.terms == other.terms
         )
 
     def __hash__(self: Self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self: Self) -> int:
         return hash(("term tuple", *self.terms))
 
     def __str__(self: Self) -> str:
         """TODO"""
-        return ",".join(tuple(str(term) for term in self.terms))
+        return self._str
+
+    @cached_property
+    def _str(self: Self) -> str:
+        # terms are never modified (string representation can be computed once)
+        return ",".join(map(str, self.terms))
 
     def __iter__(self: Self) -> Iterable[Term]:
         return iter(self.terms)
@@ -769,22 +955,22 @@ class TermTuple:
         Returns:
             `TermTuple` instance representing the concatenated term tuples.
         """
-        return TermTuple(*self.terms, *other.terms)
+        return TermTuple.from_tuple(self.terms + other.terms)
 
     def __getitem__(self: Self, index: int) -> "Term":
         return self.terms[index]
 
-    @cached_property
-    def ground(self: Self) -> bool:
-        return all(term.ground for term in self.terms)
-
     def vars(self: Self) -> Set["Variable"]:
         """Returns the variables associated with the term tuple.
 
         Returns:
             (Possibly empty) set of `Variable` instances as union of the variables of all terms.
         """  # noqa
-        return set().union(*tuple(term.vars() for term in self.terms))
+        # ground term tuples do not contain any variables
+        if self.ground:
+            return set()
+
+        return set().union(*[term.vars() for term in self.terms])
 
     def global_vars(
         self: Self, statement: Optional["Statement"] = None
@@ -814,7 +1000,7 @@ class TermTuple:
         Returns:
             Tuple of `SafetyTriplet` instances corresponding to the individual terms.
         """  # noqa
-        return tuple(term.safety(statement) for term in self.terms)
+        return tuple([term.safety(statement) for term in self.terms])
 
     def replace_arith(self: Self, var_table: "VariableTable") -> "TermTuple":
         """Replaces arithmetic terms appearing in the term tuple with arithmetic variables.
@@ -827,7 +1013,9 @@ class TermTuple:
         Returns:
             `TermTuple` instance.
         """  # noqa
-        return TermTuple(*tuple(term.replace_arith(var_table) for term in self.terms))
+        return TermTuple.from_tuple(
+            tuple([term.replace_arith(var_table) for term in self.terms])
+        )
 
     @cached_property
     def weight(self: Self) -> int:
@@ -888,6 +1076,10 @@ class TermTuple:
             if match is None:
                 return None
 
+            # empty matches (e.g., for ground terms) do not change the substitution
+            if not match:
+                continue
+
             try:
                 subst = subst + match
             except AssignmentError:
@@ -906,10 +1098,12 @@ class TermTuple:
         Returns:
             `TermTuple` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        # ground terms are not affected by substitutions (and never modified)
+        # and neither is anything else by empty substitutions
+        if self.ground or not subst:
+            return self
 
         # substitute terms recursively
-        terms = (term.substitute(subst) for term in self)
-
-        return TermTuple(*terms)
+        return TermTuple.from_tuple(
+            tuple([term.substitute(subst) for term in self.terms])
+        )
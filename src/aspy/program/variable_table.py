@@ -32,12 +32,21 @@ class VariableTable:
                 For a set, all variables are considered to be local.
         """
         self.variables = dict()
-        self.anon_counter = 0
-        self.arith_counter = 0
+        self.reset()
 
         if variables is not None:
             self.update(variables)
 
+    def reset(self: Self) -> None:
+        """Resets the variable table to an empty table.
+
+        Clears all known variables and counters in place, allowing the same
+        table to be reused (e.g., for multiple statements).
+        """
+        self.variables.clear()
+        self.anon_counter = 0
+        self.arith_counter = 0
+
     def __contains__(self: Self, var: str) -> bool:
         """Membership operator for variable table.
 
@@ -9,9 +9,9 @@ class TestSCC:
         # make sure debug mode is enabled
         assert aspy.debug()
 
-        nodes = {"A", "B", "C", "D", "E"}
-        edges = {("A", "B"), ("B", "C"), ("C", "B"), ("D", "C")}
-        target_SCCs = [{"A"}, {"B", "C"}, {"D"}, {"E"}]
+        nodes = frozenset({"A", "B", "C", "D", "E"})
+        edges = frozenset({("A", "B"), ("B", "C"), ("C", "B"), ("D", "C")})
+        target_SCCs = ({"A"}, {"B", "C"}, {"D"}, {"E"})
         graph_SCCs = compute_SCCs(nodes, edges)
 
         assert len(target_SCCs) == len(graph_SCCs)  # no extra SCCs
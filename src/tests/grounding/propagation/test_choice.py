@@ -133,7 +133,8 @@ class TestChoicePropagator:
         }
         propagator = ChoicePropagator(choice_map)
         assert propagator.choice_map == choice_map
-        assert propagator.instance_map == dict()
+        assert propagator.elements_map == dict()
+        assert propagator.guards_map == dict()
 
         # propagation
         eps_instances = {
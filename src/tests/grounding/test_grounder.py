@@ -32,19 +32,24 @@ class TestGrounder:
     def compare_to_clingo(self: Self, prog_str: str) -> None:
         """Helper method (not a test case on its own)."""
 
-        def solve_using_clingo(prog) -> Tuple[bool, Set[FrozenSet[str]]]:
+        def solve_using_clingo(prog) -> Tuple[bool, Set[FrozenSet[clingo.Symbol]]]:
             ctl = clingo.Control(message_limit=0)
             # instruct to return all models
             ctl.configuration.solve.models = 0
             ctl.add("prog", [], prog)
             ctl.ground([("prog", [])])
 
-            models = []
-            sat = ctl.solve(
-                on_model=lambda m: models.append(frozenset(str(m).split(" ")))
-            )
+            models = set()
+
+            # iterate over models directly (instead of a callback per model)
+            with ctl.solve(yield_=True) as handle:
+                for model in handle:
+                    # symbols are hashable (no need to convert them to strings)
+                    models.add(frozenset(model.symbols(shown=True)))
 
-            return sat.satisfiable, set(models)
+                sat = handle.get()
+
+            return sat.satisfiable, models
 
         # build & ground program
         prog = Program.from_string(prog_str)
@@ -154,6 +159,36 @@ class TestGrounder:
             )
             == set()
         )  # no match
+        # non-ground positive predicate literal (indexed possible literals)
+        possible = {
+            PredLiteral("p", Number(0)),
+            Neg(PredLiteral("p", Number(1))),
+            PredLiteral("p", Number(2), Number(3)),
+            PredLiteral("q", Number(4)),
+            Equal(Number(0), Number(0)),
+        }
+        possible_index = Grounder.index_literals(possible)
+        assert possible_index == {
+            ("p", 1, False): {PredLiteral("p", Number(0))},
+            ("p", 1, True): {Neg(PredLiteral("p", Number(1)))},
+            ("p", 2, False): {PredLiteral("p", Number(2), Number(3))},
+            ("q", 1, False): {PredLiteral("q", Number(4))},
+        }
+        assert Grounder.matches(
+            PredLiteral("p", Variable("X")),
+            possible=possible,
+            possible_index=possible_index,
+        ) == {
+            Substitution({Variable("X"): Number(0)})
+        }  # match
+        assert (
+            Grounder.matches(
+                PredLiteral("r", Variable("X")),
+                possible=possible,
+                possible_index=possible_index,
+            )
+            == set()
+        )  # no match
         # ground negative predicate literal
         assert Grounder.matches(Naf(Neg(PredLiteral("p", Number(0))))) == {
             Substitution()
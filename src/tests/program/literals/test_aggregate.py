@@ -683,6 +683,17 @@ class TestAggregate:
                 ),
             )
         )
+        # (order of elements is irrelevant)
+        assert hash(ground_literal) == hash(
+            AggrLiteral(
+                aggr_func,
+                ground_elements[::-1],
+                guards=(
+                    Guard(RelOp.LESS, Number(3), False),
+                    Guard(RelOp.LESS, Number(3), True),
+                ),
+            )
+        )
         # ground
         assert ground_literal.ground
         assert not var_literal.ground
@@ -26,11 +26,12 @@ class TestGuard:
         # hashing
         assert hash(rguard) == hash(Guard(RelOp.GREATER, Number(3), True))
         assert hash(lguard) == hash(Guard(RelOp.LESS, Number(3), False))
+        assert hash(rguard) == hash(lguard)  # equal guards on different sides
         # to left
-        assert lguard.to_left() == lguard
+        assert lguard.to_left() is lguard
         assert rguard.to_left() == lguard
         # to right
-        assert rguard.to_right() == rguard
+        assert rguard.to_right() is rguard
         assert lguard.to_right() == rguard
         # ground
         assert rguard.ground == lguard.ground == True  # noqa
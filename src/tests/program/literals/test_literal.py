@@ -35,6 +35,15 @@ class TestLiteral:
                 PredLiteral("q", Minus(Variable("Y"))),
             )
         )
+        # empty collections are shared
+        assert LiteralCollection() is LiteralCollection.from_iterable([])
+        # from iterable (removing duplicates)
+        assert (
+            LiteralCollection.from_iterable(
+                literal for literal in (literals[0], literals[1], literals[0])
+            )
+            == literals
+        )
         # ground
         assert not literals.ground
         # variables
@@ -62,6 +71,15 @@ class TestLiteral:
         ) == LiteralCollection(
             PredLiteral("p", String("f"), Number(1))
         )  # NOTE: substitution is invalid
+        ground_literal = PredLiteral("p", Number(0))
+        collection = LiteralCollection(ground_literal, PredLiteral("q", Variable("X")))
+        assert (
+            collection.substitute(Substitution({Variable("X"): Number(1)}))[0]
+            is ground_literal
+        )
+        assert collection.substitute(Substitution({Variable("X"): Number(1)})).without(
+            ground_literal
+        ) == LiteralCollection(PredLiteral("q", Number(1)))
         # match
         assert LiteralCollection(
             PredLiteral("p", Variable("X"), String("f")),
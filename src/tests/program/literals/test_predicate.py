@@ -82,6 +82,11 @@ class TestPredicate:
         ) == PredLiteral(
             "p", Number(1), Number(0)
         )  # NOTE: substitution is invalid
+        var_literal = PredLiteral("p", Variable("X"), Number(0))
+        assert (
+            var_literal.substitute(Substitution({Variable("Y"): Number(1)}))
+            is var_literal
+        )  # NOTE: substitution does not affect any variables
         # match
         assert PredLiteral("p", Variable("X"), String("f")).match(
             PredLiteral("p", Number(1), String("f"))
@@ -379,6 +379,12 @@ class TestChoice:
             ),
             guards=Guard(RelOp.LESS, Number(1), False),
         )  # NOTE: substitution is invalid
+        assert isinstance(
+            var_choice.substitute(Substitution({Variable("X"): Number(1)})).elements,
+            tuple,
+        )
+        # empty substitution
+        assert var_choice.substitute(Substitution()) is var_choice
 
     def test_choice_fact(self: Self):
         # make sure debug mode is enabled
@@ -807,6 +813,11 @@ class TestChoice:
             ),
             (PredLiteral("q", Number(1)), PredLiteral("q", String("f"))),
         )
+        # empty substitution
+        assert safe_var_rule.substitute(Substitution()) is safe_var_rule
+
+        # assembling (without any aggregates)
+        assert safe_var_rule.assemble_aggregates(dict()) == safe_var_rule
 
         # rewrite choice
         elements = (
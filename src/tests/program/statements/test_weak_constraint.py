@@ -36,6 +36,7 @@ class TestWeakConstraint:
         # string representation
         assert str(ground_term) == "0@1, 2,-1"
         str(var_term) == "0@X, Y,-1"
+        assert str(WeightAtLevel(Number(0), Number(1))) == "0@1"
         # equality
         assert ground_term == WeightAtLevel(
             Number(0), Number(1), (Number(2), Number(-1))
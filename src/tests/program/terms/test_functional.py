@@ -70,8 +70,8 @@ class TestFunctional:
             ground_term.substitute(
                 Substitution({String("f"): Number(0), Variable("X"): Number(1)})
             )
-            == ground_term
-        )
+            is ground_term
+        )  # ground terms are shared
         # match
         assert Functional("f", Variable("X"), String("f")).match(
             Functional("f", Number(1), String("f"))
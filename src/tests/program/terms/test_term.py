@@ -1,3 +1,5 @@
+import pickle
+from copy import deepcopy
 from typing import Self
 
 import pytest  # type: ignore
@@ -30,6 +32,7 @@ class TestTerm:
         assert str(term) == "#inf"
         # equality
         assert term == Infimum()
+        assert term is Infimum()
         # hashing
         assert hash(term) == hash(Infimum())
         # total order for terms
@@ -60,6 +63,7 @@ class TestTerm:
         assert str(term) == "#sup"
         # equality
         assert term == Supremum()
+        assert term is Supremum()
         # hashing
         assert hash(term) == hash(Supremum())
         # total order for terms
@@ -176,6 +180,10 @@ class TestTerm:
         assert term == Number(5)
         # hashing
         assert hash(term) == hash(Number(5))
+        # copying (terms are immutable)
+        assert deepcopy(term) is term
+        # pickling
+        assert pickle.loads(pickle.dumps(term)) == term
         # evaluation
         assert term.eval() == 5
         # total order for terms
@@ -304,6 +312,10 @@ class TestTerm:
         assert terms == TermTuple(Number(0), Variable("X"))
         # hashing
         assert hash(terms) == hash(TermTuple(Number(0), Variable("X")))
+        # empty term tuples are shared
+        assert TermTuple() is TermTuple.from_tuple(tuple())
+        # from tuple
+        assert TermTuple.from_tuple((Number(0), Variable("X"))) == terms
         # ground
         assert not terms.ground
         # variables
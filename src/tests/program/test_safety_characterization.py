@@ -16,6 +16,9 @@ class TestSafetyCharacterization:
         assert rule == SafetyRule(Variable("X"), {Variable("Y")})
         # hashing
         assert hash(rule) == hash(SafetyRule(Variable("X"), {Variable("Y")}))
+        # dependees are frozen
+        assert rule.dependees == frozenset({Variable("Y")})
+        assert isinstance(rule.dependees, frozenset)
 
     def test_safety_triple(self: Self):
         # make sure debug mode is enabled
@@ -93,3 +93,9 @@ class TestVariableTable:
             register=True,
         ) == ArithVariable(0, Minus(Variable("A")))
         assert ArithVariable(0, Minus(Variable("A"))) in var_table
+        # reset
+        var_table.reset()
+        assert var_table.vars() == set()
+        assert var_table.anon_counter == 0
+        assert var_table.arith_counter == 0
+        assert var_table.create("_", register=False) == AnonVariable(0)